@@ -51,6 +51,7 @@ __all__ = (
     "VoiceStateUpdate",
     "BaseEvent",
     "GuildEvent",
+    "GuildBaseEvent",
     "Login",
     "Connect",
     "Resume",
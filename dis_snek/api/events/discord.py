@@ -26,7 +26,8 @@ from typing import TYPE_CHECKING, List, Union, Optional
 import dis_snek.models
 from dis_snek.client.const import MISSING, Absent
 from dis_snek.client.utils.attr_utils import define, field, docs
-from .internal import BaseEvent, GuildEvent
+from dis_snek.models.discord.timestamp import Timestamp
+from .internal import BaseEvent, GuildBaseEvent
 
 __all__ = (
     "BanCreate",
@@ -83,7 +84,6 @@ if TYPE_CHECKING:
     from dis_snek.models.discord.guild import Guild, GuildIntegration
     from dis_snek.models.discord.channel import BaseChannel, TYPE_THREAD_CHANNEL
     from dis_snek.models.discord.message import Message
-    from dis_snek.models.discord.timestamp import Timestamp
     from dis_snek.models.discord.user import Member, User, BaseUser
     from dis_snek.models.discord.snowflake import Snowflake_Type
     from dis_snek.models.discord.activity import Activity
@@ -222,7 +222,7 @@ class GuildUpdate(BaseEvent):
 
 
 @define(kw_only=False)
-class GuildLeft(BaseEvent, GuildEvent):
+class GuildLeft(GuildBaseEvent):
     """Dispatched when a guild is left."""
 
     guild: Optional["Guild"] = field(default=MISSING)
@@ -230,7 +230,7 @@ class GuildLeft(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class GuildUnavailable(BaseEvent, GuildEvent):
+class GuildUnavailable(GuildBaseEvent):
     """Dispatched when a guild is not available."""
 
     guild: Optional["Guild"] = field(default=MISSING)
@@ -238,7 +238,7 @@ class GuildUnavailable(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class BanCreate(BaseEvent, GuildEvent):
+class BanCreate(GuildBaseEvent):
     """Dispatched when someone was banned from a guild."""
 
     user: "BaseUser" = field(metadata=docs("The user"))
@@ -250,7 +250,7 @@ class BanRemove(BanCreate):
 
 
 @define(kw_only=False)
-class GuildEmojisUpdate(BaseEvent, GuildEvent):
+class GuildEmojisUpdate(GuildBaseEvent):
     """Dispatched when a guild's emojis are updated."""
 
     before: List["CustomEmoji"] = field(factory=list)
@@ -260,7 +260,7 @@ class GuildEmojisUpdate(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class GuildStickersUpdate(BaseEvent, GuildEvent):
+class GuildStickersUpdate(GuildBaseEvent):
     """Dispatched when a guild's stickers are updated."""
 
     stickers: List["Sticker"] = field(factory=list)
@@ -268,7 +268,7 @@ class GuildStickersUpdate(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class MemberAdd(BaseEvent, GuildEvent):
+class MemberAdd(GuildBaseEvent):
     """Dispatched when a member is added to a guild."""
 
     member: "Member" = field(metadata=docs("The member who was added"))
@@ -284,7 +284,7 @@ class MemberRemove(MemberAdd):
 
 
 @define(kw_only=False)
-class MemberUpdate(BaseEvent, GuildEvent):
+class MemberUpdate(GuildBaseEvent):
     """Dispatched when a member is updated."""
 
     before: "Member" = field()
@@ -294,7 +294,7 @@ class MemberUpdate(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class RoleCreate(BaseEvent, GuildEvent):
+class RoleCreate(GuildBaseEvent):
     """Dispatched when a role is created."""
 
     role: "Role" = field()
@@ -302,7 +302,7 @@ class RoleCreate(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class RoleUpdate(BaseEvent, GuildEvent):
+class RoleUpdate(GuildBaseEvent):
     """Dispatched when a role is updated."""
 
     before: Absent["Role"] = field()
@@ -312,7 +312,7 @@ class RoleUpdate(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class RoleDelete(BaseEvent, GuildEvent):
+class RoleDelete(GuildBaseEvent):
     """Dispatched when a guild role is deleted."""
 
     id: "Snowflake_Type" = field()
@@ -322,7 +322,7 @@ class RoleDelete(BaseEvent, GuildEvent):
 
 
 @define(kw_only=False)
-class GuildMembersChunk(BaseEvent, GuildEvent):
+class GuildMembersChunk(GuildBaseEvent):
     """
     Sent in response to Guild Request Members.
 
@@ -356,7 +356,7 @@ class IntegrationUpdate(IntegrationCreate):
 
 
 @define(kw_only=False)
-class IntegrationDelete(BaseEvent, GuildEvent):
+class IntegrationDelete(GuildBaseEvent):
     """Dispatched when a guild integration is deleted."""
 
     id: "Snowflake_Type" = field()
@@ -402,7 +402,7 @@ class MessageDelete(BaseEvent):
 
 
 @define(kw_only=False)
-class MessageDeleteBulk(BaseEvent, GuildEvent):
+class MessageDeleteBulk(GuildBaseEvent):
     """Dispatched when multiple messages are deleted at once."""
 
     channel_id: "Snowflake_Type" = field()
@@ -426,7 +426,7 @@ class MessageReactionRemove(MessageReactionAdd):
 
 
 @define(kw_only=False)
-class MessageReactionRemoveAll(BaseEvent, GuildEvent):
+class MessageReactionRemoveAll(GuildBaseEvent):
     """Dispatched when all reactions are removed from a message."""
 
     message: "Message" = field()
@@ -476,12 +476,19 @@ class TypingStart(BaseEvent):
     """The channel typing is in"""
     guild: "Guild" = field()
     """The ID of the guild this typing is in"""
-    timestamp: "Timestamp" = field()
-    """unix time (in seconds) of when the user started typing"""
+    _timestamp: Union["Timestamp", int, float] = field()
+
+    @property
+    def timestamp(self) -> "Timestamp":
+        """unix time (in seconds) of when the user started typing"""
+        # the raw unix time is only converted if a listener asks for it
+        if not isinstance(self._timestamp, Timestamp):
+            self._timestamp = Timestamp.utcfromtimestamp(self._timestamp)
+        return self._timestamp
 
 
 @define(kw_only=False)
-class WebhooksUpdate(BaseEvent, GuildEvent):
+class WebhooksUpdate(GuildBaseEvent):
     """Dispatched when a guild channel webhook is created, updated, or deleted."""
 
     # Discord doesnt sent the webhook object for this event, for some reason
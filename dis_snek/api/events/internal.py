@@ -21,7 +21,7 @@ These are events dispatched by the client. This is intended as a reference so yo
 
 """
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from dis_snek.client.const import MISSING
 from dis_snek.models.discord.snowflake import to_snowflake
@@ -34,6 +34,7 @@ __all__ = (
     "Connect",
     "Disconnect",
     "GuildEvent",
+    "GuildBaseEvent",
     "Login",
     "Ready",
     "Resume",
@@ -52,7 +53,7 @@ if TYPE_CHECKING:
 _event_reg = re.compile("(?<!^)(?=[A-Z])")
 
 
-@define(slots=False)
+@define()
 class BaseEvent:
     """A base event that all other events inherit from."""
 
@@ -61,18 +62,29 @@ class BaseEvent:
     bot: "Snake" = field(kw_only=True, default=MISSING)
     """The client instance that dispatched this event."""
 
+    _class_event_name: ClassVar[str] = "base_event"
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._class_event_name = _event_reg.sub("_", cls.__name__).lower()
+
     @property
     def resolved_name(self) -> str:
         """The name of the event, defaults to the class name if not overridden."""
-        name = self.override_name or self.__class__.__name__
-        return _event_reg.sub("_", name).lower()
+        if name := self.override_name:
+            # raw gateway events are already named in snake_case
+            return name if name.islower() else _event_reg.sub("_", name).lower()
+        return self._class_event_name
 
 
-@define(slots=False, kw_only=False)
 class GuildEvent:
     """A base event that adds guild_id."""
 
-    guild_id: "Snowflake_Type" = field(metadata=docs("The ID of the guild"), converter=to_snowflake)
+    # `guild_id` is a field of GuildBaseEvent, as only one base of a slotted event may define slots
+    __slots__ = ()
+
+    guild_id: "Snowflake_Type"
+    """The ID of the guild"""
 
     @property
     def guild(self) -> "Guild":
@@ -80,6 +92,13 @@ class GuildEvent:
         return self.bot.cache.get_guild(self.guild_id)
 
 
+@define(kw_only=False)
+class GuildBaseEvent(BaseEvent, GuildEvent):
+    """A base event for events that happen within a guild."""
+
+    guild_id: "Snowflake_Type" = field(metadata=docs("The ID of the guild"), converter=to_snowflake)
+
+
 @define(kw_only=False)
 class Login(BaseEvent):
     """The bot has just logged in."""
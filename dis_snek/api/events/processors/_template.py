@@ -1,7 +1,6 @@
 import asyncio
-import functools
-import inspect
 import logging
+import sys
 from typing import TYPE_CHECKING, Callable, Coroutine
 
 from dis_snek.client.const import logger_name, MISSING, Absent
@@ -18,6 +17,7 @@ log = logging.getLogger(logger_name)
 
 
 class Processor:
+    __slots__ = ("callback", "event_name")
 
     callback: Coroutine
     event_name: str
@@ -35,7 +35,8 @@ class Processor:
             name = name.lstrip("_")
             name = name.removeprefix("on_")
 
-            return cls(coro, name)
+            # processor names key the client's processor table, interning them keeps those lookups cheap
+            return cls(coro, sys.intern(name))
 
         return wrapper
 
@@ -45,12 +46,26 @@ class EventMixinTemplate:
 
     cache: "GlobalCache"
     dispatch: Callable[["BaseEvent"], None]
+    has_listener: Callable[[str], bool]
     _init_interactions: Callable[[], Coroutine]
     synchronise_interactions: Callable[[], Coroutine]
     _user: SnakeBotUser
+    _user_id: int
     _guild_event: asyncio.Event
+    _processors: tuple[Processor, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # processors are known once the class is defined, so collect them here rather than per instance
+        processors = {}
+        for base in reversed(cls.__mro__):
+            for name, value in vars(base).items():
+                if isinstance(value, Processor):
+                    processors[name] = value
+                else:
+                    processors.pop(name, None)
+        cls._processors = tuple(processors.values())
 
     def __init__(self) -> None:
-        for call in inspect.getmembers(self):
-            if isinstance(call[1], Processor):
-                self.add_event_processor(call[1].event_name)(functools.partial(call[1].callback, self))
+        for processor in self._processors:
+            self.add_event_processor(processor.event_name)(processor.callback.__get__(self))
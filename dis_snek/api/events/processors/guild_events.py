@@ -42,6 +42,12 @@ class GuildEvents(EventMixinTemplate):
 
         self._guild_event.set()
 
+        if voice_states := event.data.get("voice_states"):
+            # cached before dispatching, so `guild.voice_states` is complete for GuildJoin listeners
+            for state in voice_states:
+                state["guild_id"] = guild.id
+            await self.cache.place_voice_state_data_bulk(voice_states)
+
         if self.fetch_members:  # noqa
             # delays events until chunking has completed
             await guild.chunk_guild(presences=True)
@@ -50,7 +56,10 @@ class GuildEvents(EventMixinTemplate):
 
     @Processor.define()
     async def _on_raw_guild_update(self, event: "RawGatewayEvent") -> None:
-        before = copy.copy(await self.cache.fetch_guild(event.data.get("id")))
+        before = MISSING
+        if self.has_listener("guild_update"):
+            # only snapshot the cached guild if something will receive it
+            before = copy.copy(await self.cache.fetch_guild(event.data.get("id")))
         self.dispatch(events.GuildUpdate(before or MISSING, self.cache.place_guild_data(event.data)))
 
     @Processor.define()
@@ -110,7 +119,7 @@ class GuildEvents(EventMixinTemplate):
         else:
             before = []
 
-        after = [self.cache.place_emoji_data(guild_id, emoji) for emoji in emojis]
+        after = self.cache.place_emoji_data_bulk(guild_id, emojis)
 
         self.dispatch(
             GuildEmojisUpdate(
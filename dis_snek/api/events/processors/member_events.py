@@ -35,5 +35,8 @@ class MemberEvents(EventMixinTemplate):
     @Processor.define()
     async def _on_raw_guild_member_update(self, event: "RawGatewayEvent") -> None:
         g_id = event.data.pop("guild_id")
-        before = copy.copy(self.cache.get_member(g_id, event.data["user"]["id"])) or MISSING
+        before = MISSING
+        if self.has_listener("member_update"):
+            # only snapshot the cached member if something will receive it
+            before = copy.copy(self.cache.get_member(g_id, event.data["user"]["id"])) or MISSING
         self.dispatch(events.MemberUpdate(g_id, before, self.cache.place_member_data(g_id, event.data)))
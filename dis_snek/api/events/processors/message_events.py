@@ -70,8 +70,10 @@ class MessageEvents(EventMixinTemplate):
             event: raw message update event
 
         """
-        # a copy is made because the cache will update the original object in memory
-        before = copy.copy(self.cache.get_message(event.data.get("channel_id"), event.data.get("id")))
+        before = None
+        if self.has_listener("message_update"):
+            # a copy is made because the cache will update the original object in memory
+            before = copy.copy(self.cache.get_message(event.data.get("channel_id"), event.data.get("id")))
         after = self.cache.place_message_data(event.data)
         self.dispatch(events.MessageUpdate(before=before, after=after))
 
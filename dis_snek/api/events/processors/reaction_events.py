@@ -17,44 +17,51 @@ log = logging.getLogger(logger_name)
 
 class ReactionEvents(EventMixinTemplate):
     async def _handle_message_reaction_change(self, event: "RawGatewayEvent", add: bool) -> None:
-        if member := event.data.get("member"):
-            author = self.cache.place_member_data(event.data.get("guild_id"), member)
-        else:
-            author = await self.cache.fetch_user(event.data.get("user_id"))
+        data = event.data
+        channel_id = data.get("channel_id")
+        message_id = data.get("message_id")
+        guild_id = data.get("guild_id")
+        user_id = int(data["user_id"])
+
+        if member := data.get("member"):
+            author = self.cache.place_member_data(guild_id, member)
 
-        emoji = PartialEmoji.from_dict(event.data.get("emoji"))  # type: ignore
-        message = self.cache.get_message(event.data.get("channel_id"), event.data.get("message_id"))
+        emoji = PartialEmoji.from_dict(data.get("emoji"))  # type: ignore
+        message = self.cache.get_message(channel_id, message_id)
 
         if message:
-            for i in range(len(message.reactions)):
-                r = message.reactions[i]
-                if r.emoji == emoji:
-                    if add:
-                        r.count += 1
-                    else:
-                        r.count -= 1
-
-                    if r.count <= 0:
-                        message.reactions.pop(i)
-                    else:
-                        message.reactions[i] = r
-                    break
+            reaction_index = message._get_reaction_index()
+            key = emoji.id or emoji.name
+            if r := reaction_index.get(key):
+                if add:
+                    r.count += 1
+                else:
+                    r.count -= 1
+
+                if r.count <= 0:
+                    del reaction_index[key]
+                    message.reactions.remove(r)
             else:
-                message.reactions.append(
-                    Reaction.from_dict(
-                        {
-                            "count": 1,
-                            "me": author.id == self.user.id,  # type: ignore
-                            "emoji": emoji.to_dict(),
-                            "message_id": message.id,
-                            "channel_id": message._channel_id,
-                        },
-                        self,  # type: ignore
-                    )
+                reaction_index[key] = r = Reaction.from_dict(
+                    {
+                        "count": 1,
+                        "me": user_id == self._user_id,
+                        "emoji": emoji,
+                        "message_id": message.id,
+                        "channel_id": message._channel_id,
+                    },
+                    self,  # type: ignore
                 )
+                message.reactions.append(r)
 
-        else:
-            message = await self.cache.fetch_message(event.data.get("channel_id"), event.data.get("message_id"))
+        if not self.has_listener("message_reaction_add" if add else "message_reaction_remove"):
+            # the cache is up to date, fetching the message would only serve the event
+            return
+
+        if not member:
+            author = await self.cache.fetch_user(user_id)
+        if not message:
+            message = await self.cache.fetch_message(channel_id, message_id)
 
         if add:
             self.dispatch(events.MessageReactionAdd(message=message, emoji=emoji, author=author))
@@ -71,11 +78,18 @@ class ReactionEvents(EventMixinTemplate):
 
     @Processor.define()
     async def _on_raw_message_reaction_remove_all(self, event: "RawGatewayEvent") -> None:
-        if message := self.cache.get_message(event.data["channel_id"], event.data["message_id"]):
+        data = event.data
+        channel_id = data["channel_id"]
+        message_id = data["message_id"]
+
+        if message := self.cache.get_message(channel_id, message_id):
             message.reactions = []
+
+        if not self.has_listener("message_reaction_remove_all"):
+            return
         self.dispatch(
             events.MessageReactionRemoveAll(
-                event.data.get("guild_id"),
-                await self.cache.fetch_message(event.data["channel_id"], event.data["message_id"]),
+                data.get("guild_id"),
+                await self.cache.fetch_message(channel_id, message_id),
             )
         )
@@ -24,17 +24,19 @@ class RoleEvents(EventMixinTemplate):
         guild = self.cache.get_guild(g_id)
         guild._role_ids.add(r_id)
 
-        role = self.cache.place_role_data(g_id, [event.data.get("role")])[r_id]
+        role = self.cache.place_single_role_data(g_id, event.data.get("role"))
         self.dispatch(events.RoleCreate(g_id, role))
 
     @Processor.define()
     async def _on_raw_guild_role_update(self, event: "RawGatewayEvent") -> None:
         g_id = int(event.data.get("guild_id"))
         r_data = event.data.get("role")
-        before = copy.copy(self.cache.get_role(r_data["id"]) or MISSING)
+        before = MISSING
+        if self.has_listener("role_update"):
+            # only snapshot the cached role if something will receive it
+            before = copy.copy(self.cache.get_role(r_data["id"]) or MISSING)
 
-        after = self.cache.place_role_data(g_id, [r_data])
-        after = after[int(event.data["role"]["id"])]
+        after = self.cache.place_single_role_data(g_id, r_data)
 
         self.dispatch(events.RoleUpdate(g_id, before, after))
 
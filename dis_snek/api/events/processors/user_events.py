@@ -4,7 +4,7 @@ import dis_snek.api.events as events
 
 from dis_snek.client.const import logger_name
 from ._template import EventMixinTemplate, Processor
-from dis_snek.models import User, Member, BaseChannel, Timestamp, to_snowflake, Activity
+from dis_snek.models import User, Member, BaseChannel, to_snowflake, Activity
 from dis_snek.models.discord.enums import Status
 
 if TYPE_CHECKING:
@@ -14,6 +14,8 @@ __all__ = ("UserEvents",)
 
 log = logging.getLogger(logger_name)
 
+_STATUS_LOOKUP = {status.value: status for status in Status}
+
 
 class UserEvents(EventMixinTemplate):
     @Processor.define()
@@ -28,21 +30,25 @@ class UserEvents(EventMixinTemplate):
         author: Union[User, Member]
         channel: BaseChannel
         guild = None
+        data = event.data
 
-        if member := event.data.get("member"):
-            author = self.cache.place_member_data(event.data.get("guild_id"), member)
-            guild = await self.cache.fetch_guild(event.data.get("guild_id"))
+        if member := data.get("member"):
+            guild_id = data.get("guild_id")
+            author = self.cache.place_member_data(guild_id, member)
+            guild = self.cache.get_guild(guild_id) or await self.cache.fetch_guild(guild_id)
         else:
-            author = await self.cache.fetch_user(event.data.get("user_id"))
+            author = await self.cache.fetch_user(data.get("user_id"))
 
-        channel = await self.cache.fetch_channel(event.data.get("channel_id"))
+        channel_id = data.get("channel_id")
+        # typing mostly happens in cached channels, only await a fetch when it isn't
+        channel = self.cache.get_channel(channel_id) or await self.cache.fetch_channel(channel_id)
 
         self.dispatch(
             events.TypingStart(
                 author=author,
                 channel=channel,
                 guild=guild,
-                timestamp=Timestamp.utcfromtimestamp(event.data.get("timestamp")),
+                timestamp=data.get("timestamp"),
             )
         )
 
@@ -55,11 +61,12 @@ class UserEvents(EventMixinTemplate):
             event: raw presence update event
 
         """
-        g_id = to_snowflake(event.data["guild_id"])
-        if user := self.cache.get_user(event.data["user"]["id"]):
-            user.status = Status[event.data["status"].upper()]
-            user.activities = Activity.from_list(event.data.get("activities"))
+        data = event.data
+        g_id = to_snowflake(data["guild_id"])
+        if user := self.cache.get_user(data["user"]["id"]):
+            user.status = _STATUS_LOOKUP[data["status"]]
+            user.activities = Activity.from_list(data.get("activities"))
 
             self.dispatch(
-                events.PresenceUpdate(user, user.status, user.activities, event.data.get("client_status", None), g_id)
+                events.PresenceUpdate(user, user.status, user.activities, data.get("client_status", None), g_id)
             )
@@ -235,8 +235,12 @@ class GatewayClient(WebsocketClient):
                 else:
                     log.debug(f"No processor for `{event_name}`")
 
-        self.state.client.dispatch(events.RawGatewayEvent(data, override_name="raw_socket_receive"))
-        self.state.client.dispatch(events.RawGatewayEvent(data, override_name=f"raw_{event.lower()}"))
+        # raw events are only built if something will receive them, most bots never listen for these
+        client = self.state.client
+        if client.has_listener("raw_socket_receive"):
+            client.dispatch(events.RawGatewayEvent(data, override_name="raw_socket_receive"))
+        if client.has_listener(raw_name := f"raw_{event.lower()}"):
+            client.dispatch(events.RawGatewayEvent(data, override_name=raw_name))
 
     def close(self) -> None:
         """Shutdown the websocket connection."""
@@ -1,12 +1,14 @@
 """This file handles the interaction with discords http endpoints."""
 import asyncio
+import copy
 import logging
+import time
 from typing import Any, Dict, Optional, Union
 from urllib.parse import quote as _uriquote
 from weakref import WeakValueDictionary
 
 import aiohttp
-from aiohttp import BaseConnector, ClientSession, ClientWebSocketResponse, FormData
+from aiohttp import BaseConnector, ClientSession, ClientWebSocketResponse, FormData, TCPConnector
 from multidict import CIMultiDictProxy
 
 from dis_snek.api.http.http_requests import (
@@ -34,7 +36,8 @@ from dis_snek.client.const import (
     __api_version__,
 )
 from dis_snek.client.errors import DiscordError, Forbidden, GatewayNotFound, HTTPException, NotFound, LoginError
-from dis_snek.client.utils.input_utils import response_decode
+from dis_snek.client.utils.cache import TTLCache
+from dis_snek.client.utils.input_utils import OverriddenJson, response_decode
 from dis_snek.client.utils.serializer import dict_filter_missing
 from dis_snek.models import CooldownSystem
 from .route import Route
@@ -154,10 +157,13 @@ class HTTPClient(
 
         self.ratelimit_locks: WeakValueDictionary[str, BucketLock] = WeakValueDictionary()
         self._endpoints = {}
+        self.response_cache: TTLCache[str, Any] = TTLCache(ttl=300, soft_limit=0, hard_limit=4096)
+        """Responses of GET requests made with `use_cache`, keyed by url"""
 
         self.user_agent: str = (
             f"DiscordBot ({__repo_url__} {__version__} Python/{__py_version__}) aiohttp/{aiohttp.__version__}"
         )
+        self._headers: dict[str, str] = {"User-Agent": self.user_agent}
 
     def get_ratelimit(self, route: Route) -> BucketLock:
         """
@@ -202,6 +208,7 @@ class HTTPClient(
         data: Absent[Union[dict, FormData]] = MISSING,
         reason: Absent[str] = MISSING,
         params: Absent[dict] = MISSING,
+        use_cache: bool = False,
         **kwargs: Dict[str, Any],
     ) -> Any:
         """
@@ -211,12 +218,20 @@ class HTTPClient(
             route: The route to take
             json: A json payload to send in the request
             reason: Attach a reason to this request, used for audit logs
+            use_cache: Answer GET requests from `response_cache` if possible, and cache the response
 
         """
-        # Assemble headers
-        kwargs["headers"] = {"User-Agent": self.user_agent}
-        if self.token:
-            kwargs["headers"]["Authorization"] = f"Bot {self.token}"
+        use_cache = use_cache and route.method == "GET"
+        if use_cache and (cached := dict.get(self.response_cache, route.url)) is not None:
+            # the cache only sweeps expired entries on write, so a stale hit has to be caught here
+            if cached.is_expired(time.monotonic()):
+                self.response_cache.pop(route.url, None)
+            else:
+                # callers are free to mutate what they get back, so the cache only ever hands out copies
+                return copy.deepcopy(cached.value)
+
+        # Assemble headers, the static ones are built once at login
+        kwargs["headers"] = self._headers.copy()
         if reason not in (None, MISSING):
             kwargs["headers"]["X-Audit-Log-Reason"] = _uriquote(reason, safe="/ ")
 
@@ -291,6 +306,8 @@ class HTTPClient(
                         log.debug(
                             f"{route.endpoint} Received {response.status} :: [{lock.remaining}/{lock.limit} calls remaining]"
                         )
+                        if use_cache:
+                            self.response_cache[route.url] = copy.deepcopy(result)
                         return result
                 except OSError as e:
                     if attempt < self._max_attempts - 1 and e.errno in (54, 10054):
@@ -328,8 +345,13 @@ class HTTPClient(
             The currently logged in bot's data
 
         """
-        self.__session = ClientSession(connector=self.connector)
+        # one session (and so one pool of keep-alive connections) is shared by every request
+        self.__session = ClientSession(
+            connector=self.connector or TCPConnector(ttl_dns_cache=300, enable_cleanup_closed=True),
+            json_serialize=OverriddenJson.dumps,
+        )
         self.token = token
+        self._headers = {"User-Agent": self.user_agent, "Authorization": f"Bot {token}"}
         try:
             return await self.request(Route("GET", "/users/@me"))
         except HTTPException as e:
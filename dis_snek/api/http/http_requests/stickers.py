@@ -27,7 +27,7 @@ class StickerRequests:
             Sticker or None
 
         """
-        return await self.request(Route("GET", f"/stickers/{sticker_id}"))
+        return await self.request(Route("GET", "/stickers/{sticker_id}", sticker_id=sticker_id))
 
     async def list_nitro_sticker_packs(self) -> List[discord_typings.StickerPackData]:
         """
@@ -50,7 +50,7 @@ class StickerRequests:
             List of Stickers or None
 
         """
-        return await self.request(Route("GET", f"/guilds/{guild_id}/stickers"))
+        return await self.request(Route("GET", "/guilds/{guild_id}/stickers", guild_id=guild_id))
 
     async def get_guild_sticker(
         self, guild_id: "Snowflake_Type", sticker_id: "Snowflake_Type"
@@ -66,7 +66,9 @@ class StickerRequests:
             Sticker or None
 
         """
-        return await self.request(Route("GET", f"/guilds/{guild_id}/stickers/{sticker_id}"))
+        return await self.request(
+            Route("GET", "/guilds/{guild_id}/stickers/{sticker_id}", guild_id=guild_id, sticker_id=sticker_id)
+        )
 
     async def create_guild_sticker(
         self, payload: "FormData", guild_id: "Snowflake_Type", reason: Optional[str] = MISSING
@@ -83,7 +85,9 @@ class StickerRequests:
             The new sticker data on success.
 
         """
-        return await self.request(Route("POST", f"/guild/{guild_id}/stickers"), data=payload, reason=reason)
+        return await self.request(
+            Route("POST", "/guild/{guild_id}/stickers", guild_id=guild_id), data=payload, reason=reason
+        )
 
     async def modify_guild_sticker(
         self, payload: dict, guild_id: "Snowflake_Type", sticker_id: "Snowflake_Type", reason: Optional[str] = MISSING
@@ -102,7 +106,9 @@ class StickerRequests:
 
         """
         return await self.request(
-            Route("PATCH", f"/guild/{guild_id}/stickers/{sticker_id}"), data=payload, reason=reason
+            Route("PATCH", "/guild/{guild_id}/stickers/{sticker_id}", guild_id=guild_id, sticker_id=sticker_id),
+            data=payload,
+            reason=reason,
         )
 
     async def delete_guild_sticker(
@@ -120,4 +126,7 @@ class StickerRequests:
             Returns 204 No Content on success.
 
         """
-        return await self.request(Route("DELETE", f"/guild/{guild_id}/stickers/{sticker_id}"), reason=reason)
+        return await self.request(
+            Route("DELETE", "/guild/{guild_id}/stickers/{sticker_id}", guild_id=guild_id, sticker_id=sticker_id),
+            reason=reason,
+        )
@@ -24,18 +24,19 @@ class UserRequests:
         """
         return await self.get_user("@me")
 
-    async def get_user(self, user_id: "Snowflake_Type") -> discord_typings.UserData:
+    async def get_user(self, user_id: "Snowflake_Type", use_cache: bool = False) -> discord_typings.UserData:
         """
         Get a user object for a given user ID.
 
         Args:
             user_id: The user to get.
+            use_cache: Reuse a response from the last 5 minutes rather than requesting it again.
 
         Returns:
             The user object.
 
         """
-        return await self.request(Route("GET", f"/users/{user_id}"))
+        return await self.request(Route("GET", f"/users/{user_id}"), use_cache=use_cache)
 
     async def modify_client_user(self, payload: dict) -> discord_typings.UserData:
         """
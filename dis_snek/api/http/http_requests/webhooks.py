@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Any, List, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
 
 import discord_typings
 
@@ -12,8 +13,19 @@ if TYPE_CHECKING:
     from dis_snek.models.discord.snowflake import Snowflake_Type
 
 
+def _webhook_endpoint(
+    webhook_id: "Snowflake_Type", webhook_token: Optional[str] = None, message_id: Optional["Snowflake_Type"] = None
+) -> str:
+    """Build the path to a webhook, or one of its messages. The token is left out if there isn't one."""
+    endpoint = f"/webhooks/{webhook_id}/{webhook_token}" if webhook_token else f"/webhooks/{webhook_id}"
+    if message_id:
+        return f"{endpoint}/messages/{message_id}"
+    return endpoint
+
+
 class WebhookRequests:
     request: Any
+    response_cache: Any
 
     async def create_webhook(
         self, channel_id: "Snowflake_Type", name: str, avatar: Any = None
@@ -57,21 +69,30 @@ class WebhookRequests:
         """
         return await self.request(Route("GET", f"/guilds/{guild_id}/webhooks"))
 
-    async def get_webhook(self, webhook_id: "Snowflake_Type", webhook_token: str = None) -> discord_typings.WebhookData:
+    async def get_webhook(
+        self, webhook_id: "Snowflake_Type", webhook_token: str = None, use_cache: bool = False
+    ) -> discord_typings.WebhookData:
         """
         Return the new webhook object for the given id.
 
         Args:
             webhook_id: The ID of the webhook to get
             webhook_token: The token for the webhook
+            use_cache: Reuse a response from the last 5 minutes rather than requesting it again
 
         Returns:
             Webhook object
 
         """
-        endpoint = f"/webhooks/{webhook_id}{f'/{webhook_token}' if webhook_token else ''}"
+        endpoint = _webhook_endpoint(webhook_id, webhook_token)
+
+        return await self.request(Route("GET", endpoint), use_cache=use_cache)
 
-        return await self.request(Route("GET", endpoint))
+    def _forget_webhook(self, webhook_id: "Snowflake_Type", webhook_token: str = None) -> None:
+        """Drop any cached responses for a webhook that has been changed."""
+        self.response_cache.pop(Route("GET", _webhook_endpoint(webhook_id)).url, None)
+        if webhook_token:
+            self.response_cache.pop(Route("GET", _webhook_endpoint(webhook_id, webhook_token)).url, None)
 
     async def modify_webhook(
         self,
@@ -92,11 +113,14 @@ class WebhookRequests:
             webhook_token: The token for the webhook
 
         """
-        endpoint = f"/webhooks/{webhook_id}{f'/{webhook_token}' if webhook_token else ''}"
+        endpoint = _webhook_endpoint(webhook_id, webhook_token)
 
-        return await self.request(
-            Route("PATCH", endpoint), data={"name": name, "avatar": avatar, "channel_id": channel_id}
-        )
+        try:
+            return await self.request(
+                Route("PATCH", endpoint), data={"name": name, "avatar": avatar, "channel_id": channel_id}
+            )
+        finally:
+            self._forget_webhook(webhook_id, webhook_token)
 
     async def delete_webhook(self, webhook_id: "Snowflake_Type", webhook_token: str = None) -> None:
         """
@@ -110,9 +134,12 @@ class WebhookRequests:
             Webhook object
 
         """
-        endpoint = f"/webhooks/{webhook_id}{f'/{webhook_token}' if webhook_token else ''}"
+        endpoint = _webhook_endpoint(webhook_id, webhook_token)
 
-        return await self.request(Route("DELETE", endpoint))
+        try:
+            return await self.request(Route("DELETE", endpoint))
+        finally:
+            self._forget_webhook(webhook_id, webhook_token)
 
     async def execute_webhook(
         self,
@@ -138,11 +165,26 @@ class WebhookRequests:
 
         """
         return await self.request(
-            Route("POST", f"/webhooks/{webhook_id}/{webhook_token}"),
+            Route("POST", _webhook_endpoint(webhook_id, webhook_token)),
             params=dict_filter_none({"wait": "true" if wait else "false", "thread_id": thread_id}),
             data=payload,
         )
 
+    async def execute_many(
+        self, calls: List[Dict[str, Any]]
+    ) -> List[Union[Optional[discord_typings.MessageData], BaseException]]:
+        """
+        Execute several webhooks concurrently, rather than one after another.
+
+        Args:
+            calls: The keyword arguments for each `execute_webhook` call
+
+        Returns:
+            The result of each call in order, failed calls return their exception rather than raising
+
+        """
+        return await asyncio.gather(*[self.execute_webhook(**call) for call in calls], return_exceptions=True)
+
     async def get_webhook_message(
         self, webhook_id: "Snowflake_Type", webhook_token: str, message_id: "Snowflake_Type"
     ) -> discord_typings.MessageData:
@@ -158,7 +200,7 @@ class WebhookRequests:
             A message object on success
 
         """
-        return await self.request(Route("GET", f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"))
+        return await self.request(Route("GET", _webhook_endpoint(webhook_id, webhook_token, message_id)))
 
     async def edit_webhook_message(
         self, webhook_id: "Snowflake_Type", webhook_token: str, message_id: "Snowflake_Type", payload: dict
@@ -177,7 +219,7 @@ class WebhookRequests:
 
         """
         return await self.request(
-            Route("PATCH", f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"), data=payload
+            Route("PATCH", _webhook_endpoint(webhook_id, webhook_token, message_id)), data=payload
         )
 
     async def delete_webhook_message(
@@ -192,4 +234,4 @@ class WebhookRequests:
             message_id: The ID of a message sent by this webhook
 
         """
-        return await self.request(Route("DELETE", f"/webhooks/{webhook_id}/{webhook_token}/messages/{message_id}"))
+        return await self.request(Route("DELETE", _webhook_endpoint(webhook_id, webhook_token, message_id)))
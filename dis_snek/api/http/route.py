@@ -10,12 +10,31 @@ __all__ = ("Route",)
 
 class Route:
     BASE: ClassVar[str] = f"https://discord.com/api/v{__api_version__}"
+    __slots__ = (
+        "path",
+        "method",
+        "params",
+        "channel_id",
+        "guild_id",
+        "webhook_id",
+        "webhook_token",
+        "known_bucket",
+        "endpoint",
+        "url",
+        "_bucket",
+    )
+
     path: str
     params: dict[str, str | int]
 
     webhook_id: Optional["Snowflake_Type"]
     webhook_token: Optional[str]
 
+    endpoint: str
+    """The endpoint for this route"""
+    url: str
+    """The full url for this route"""
+
     def __init__(self, method: str, path: str, **parameters: Any) -> None:
         self.path: str = path
         self.method: str = method
@@ -28,6 +47,16 @@ class Route:
 
         self.known_bucket: Optional[str] = None
 
+        # a route never changes once created, so its strings are built once rather than on every lookup
+        self.endpoint = f"{method} {path}"
+        self.url = f"{self.BASE}{path}".format_map(
+            {k: _uriquote(v) if isinstance(v, str) else v for k, v in parameters.items()}
+        )
+        if self.webhook_token:
+            self._bucket = f"{self.webhook_id}{self.webhook_token}:{self.channel_id}:{self.guild_id}:{self.endpoint}"
+        else:
+            self._bucket = f"{self.channel_id}:{self.guild_id}:{self.endpoint}"
+
     def __eq__(self, other: "Route") -> bool:
         if isinstance(other, Route):
             return self.rl_bucket == other.rl_bucket
@@ -45,21 +74,4 @@ class Route:
     @property
     def rl_bucket(self) -> str:
         """This route's full rate limit bucket"""
-        if self.known_bucket:
-            return self.known_bucket
-
-        if self.webhook_token:
-            return f"{self.webhook_id}{self.webhook_token}:{self.channel_id}:{self.guild_id}:{self.endpoint}"
-        return f"{self.channel_id}:{self.guild_id}:{self.endpoint}"
-
-    @property
-    def endpoint(self) -> str:
-        """The endpoint for this route"""
-        return f"{self.method} {self.path}"
-
-    @property
-    def url(self) -> str:
-        """The full url for this route"""
-        return f"{self.BASE}{self.path}".format_map(
-            {k: _uriquote(v) if isinstance(v, str) else v for k, v in self.params.items()}
-        )
+        return self.known_bucket or self._bucket
@@ -108,45 +108,50 @@ class Player(threading.Thread):
         log.debug(f"Now playing {self.current_audio!r}")
         start = None
 
+        # bound once, as the loop below runs every frame (50 times a second)
+        ws = self.state.ws
+        audio = self.current_audio
+        encoder = self._encoder
+        read = audio.read
+        send_packet = ws.send_packet
+        frame_size = encoder.frame_size
+        delay = encoder.delay
+        perf_counter = time.perf_counter
+        sleep = time.sleep
+
         try:
             while not self._stop_event.is_set():
-                if not self.state.ws.ready.is_set() or not self._resume.is_set():
-                    asyncio.run_coroutine_threadsafe(self.state.ws.speaking(False), self.loop)
+                if not ws.ready.is_set() or not self._resume.is_set():
+                    asyncio.run_coroutine_threadsafe(ws.speaking(False), self.loop)
                     log.debug("Voice playback has been suspended!")
 
-                    wait_for = []
-
-                    if not self.state.ws.ready.is_set():
-                        wait_for.append(self.state.ws.ready)
-                    if not self._resume.is_set():
-                        wait_for.append(self._resume)
-
                     with self._cond:
-                        while not (self._stop_event.is_set() or all(x.is_set() for x in wait_for)):
-                            self._cond.wait()
+                        self._cond.wait_for(
+                            lambda: self._stop_event.is_set() or (ws.ready.is_set() and self._resume.is_set())
+                        )
                     if self._stop_event.is_set():
                         continue
 
-                    asyncio.run_coroutine_threadsafe(self.state.ws.speaking(), self.loop)
+                    asyncio.run_coroutine_threadsafe(ws.speaking(), self.loop)
                     log.debug("Voice playback has been resumed!")
                     start = None
                     loops = 0
 
-                if data := self.current_audio.read(self._encoder.frame_size):
-                    self.state.ws.send_packet(data, self._encoder, needs_encode=self.current_audio.needs_encode)
+                if data := read(frame_size):
+                    send_packet(data, encoder, needs_encode=audio.needs_encode)
                 else:
-                    if self.current_audio.locked_stream or not self.current_audio.audio_complete:
+                    if audio.locked_stream or not audio.audio_complete:
                         # if more audio is expected
-                        self.state.ws.send_packet(b"\xF8\xFF\xFE", self._encoder, needs_encode=False)
+                        send_packet(b"\xF8\xFF\xFE", encoder, needs_encode=False)
                     else:
                         break
 
                 if not start:
-                    start = time.perf_counter()
+                    start = perf_counter()
 
                 loops += 1
                 self._sent_payloads += 1  # used for duration calc
-                time.sleep(max(0.0, start + (self._encoder.delay * loops) - time.perf_counter()))
+                sleep(max(0.0, start + (delay * loops) - perf_counter()))
         finally:
             asyncio.run_coroutine_threadsafe(self.state.ws.speaking(False), self.loop)
             self.current_audio.cleanup()
@@ -106,6 +106,12 @@ log = logging.getLogger(logger_name)
 
 __all__ = ("Snake",)
 
+try:
+    import uvloop
+except ImportError:
+    # uvloop is an optional speedup, and isn't available on windows
+    uvloop = None
+
 
 class Snake(
     processors.ChannelEvents,
@@ -258,6 +264,7 @@ class Snake(
             self._activity: Activity = activity
 
         self._user: Absent[SnakeBotUser] = MISSING
+        self._user_id: Absent[int] = MISSING
         self._app: Absent[Application] = MISSING
 
         # collections
@@ -675,6 +682,7 @@ class Snake(
         log.debug("Attempting to login")
         me = await self.http.login(token.strip())
         self._user = SnakeBotUser.from_dict(me, self)
+        self._user_id = int(self._user.id)
         self.cache.place_user_data(me)
         self._app = Application.from_dict(await self.http.get_current_bot_information(), self)
         self._mention_reg = re.compile(rf"^(<@!?{self.user.id}*>\s)")
@@ -707,6 +715,9 @@ class Snake(
             token: Your bot's token
 
         """
+        if uvloop:
+            # uvloop's event loop is considerably cheaper per await than asyncio's default
+            uvloop.install()
         try:
             asyncio.run(self.astart(token))
         except KeyboardInterrupt:
@@ -736,19 +747,18 @@ class Snake(
             event: The event to be dispatched.
 
         """
-        listeners = self.listeners.get(event.resolved_name, [])
+        event_name = event.resolved_name
+        listeners = self.listeners.get(event_name, [])
         if listeners:
-            log.debug(f"Dispatching Event: {event.resolved_name}")
+            log.debug(f"Dispatching Event: {event_name}")
             event.bot = self
             for _listen in listeners:
                 try:
                     self._queue_task(_listen, event, *args, **kwargs)
                 except Exception as e:
-                    raise BotException(
-                        f"An error occurred attempting during {event.resolved_name} event processing"
-                    ) from e
+                    raise BotException(f"An error occurred attempting during {event_name} event processing") from e
 
-        _waits = self.waits.get(event.resolved_name, [])
+        _waits = self.waits.get(event_name, [])
         if _waits:
             index_to_remove = []
             for i, _wait in enumerate(_waits):
@@ -759,6 +769,19 @@ class Snake(
             for idx in sorted(index_to_remove, reverse=True):
                 _waits.pop(idx)
 
+    def has_listener(self, event_name: str) -> bool:
+        """
+        Check if dispatching an event would reach anything.
+
+        Args:
+            event_name: The name of the event to check
+
+        Returns:
+            True if there is a listener or `wait_for` registered for this event
+
+        """
+        return bool(self.listeners.get(event_name) or self.waits.get(event_name))
+
     async def wait_until_ready(self) -> None:
         """Waits for the client to become ready."""
         await self._ready.wait()
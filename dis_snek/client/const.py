@@ -32,10 +32,9 @@ Attributes:
     Absent Union[T, Missing]: A type hint for a value that may be MISSING.
 
 """
-import inspect
 import sys
-from collections import defaultdict
 from importlib.metadata import version as _v
+from types import MappingProxyType
 from typing import TypeVar, Union
 
 __all__ = (
@@ -117,9 +116,8 @@ class Singleton(type):
 class Sentinel(metaclass=Singleton):
     @staticmethod
     def _get_caller_module() -> str:
-        stack = inspect.stack()
-
-        caller = stack[2][0]
+        # only the caller's frame is needed, inspect.stack() would build (and read the source of) every frame
+        caller = sys._getframe(2)
         return caller.f_globals.get("__name__")
 
     def __init__(self) -> None:
@@ -166,13 +164,13 @@ GLOBAL_SCOPE = GlobalScope()
 MISSING = Missing()
 MENTION_PREFIX = MentionPrefix()
 
-PREMIUM_GUILD_LIMITS = defaultdict(
-    lambda: {"emoji": 50, "stickers": 0, "bitrate": 96000, "filesize": 8388608},
+PREMIUM_GUILD_LIMITS = MappingProxyType(
     {
+        0: {"emoji": 50, "stickers": 0, "bitrate": 96000, "filesize": 8388608},
         1: {"emoji": 100, "stickers": 15, "bitrate": 128000, "filesize": 8388608},
         2: {"emoji": 150, "stickers": 30, "bitrate": 256000, "filesize": 52428800},
         3: {"emoji": 250, "stickers": 60, "bitrate": 384000, "filesize": 104857600},
-    },
+    }
 )
 
 
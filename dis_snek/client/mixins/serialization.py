@@ -1,5 +1,6 @@
+import keyword
 import logging
-from typing import Any, Dict, List, Type
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, Union
 
 import attrs
 
@@ -12,22 +13,106 @@ __all__ = ("DictSerializationMixin",)
 log = logging.getLogger(const.logger_name)
 
 
+def _generate_fast_init(cls: Type["DictSerializationMixin"]) -> Callable:
+    """
+    Generate a function that builds `cls` from processed data, with one keyword argument per field.
+
+    This is equivalent to `cls(**cls._filter_kwargs(data, cls._get_init_keys()))`, but skips building the filtered
+    dict. Absent keys are given their field's default, which attrs would have used anyway.
+
+    Args:
+        cls: The attrs class to generate the function for
+
+    Returns:
+        The generated function, taking the data and any `cls._fast_init_args`
+
+    """
+    provided = cls._fast_init_args
+    args = ", ".join(("data", *provided))
+    passed = [f"{name}={name}" for name in provided]
+    fallback = f"cls({''.join(f'{p}, ' for p in passed)}**cls._filter_kwargs(data, cls._get_init_keys()))"
+
+    namespace = {"cls": cls}
+    required = []
+    generated = True
+    for i, field in enumerate(attrs.fields(cls)):
+        if not field.init:
+            continue
+        key = field.name.removeprefix("_")
+        if key in provided:
+            continue
+        if key != field.name.lstrip("_") or keyword.iskeyword(key):
+            # attrs would name this argument differently from its key, not worth special casing
+            generated = False
+            break
+
+        default = field.default
+        if default is attrs.NOTHING:
+            required.append(key)
+            passed.append(f"{key}=data[{key!r}]")
+        elif isinstance(default, attrs.Factory):
+            if default.takes_self:
+                generated = False
+                break
+            namespace[f"_factory_{i}"] = default.factory
+            passed.append(f"{key}=data[{key!r}] if {key!r} in data else _factory_{i}()")
+        else:
+            namespace[f"_default_{i}"] = default
+            passed.append(f"{key}=data.get({key!r}, _default_{i})")
+
+    lines = [f"def fast_init({args}):"]
+    if not generated:
+        lines.append(f"    return {fallback}")
+    else:
+        if required:
+            # a required key is missing, let the general path raise the usual error
+            namespace["_required"] = frozenset(required)
+            lines.append("    if not data.keys() >= _required:")
+            lines.append(f"        return {fallback}")
+        lines.append(f"    return cls({', '.join(passed)})")
+
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["fast_init"]
+
+
 @define(slots=False)
 class DictSerializationMixin:
+    __slots__ = ()
+
+    _keys: ClassVar[Optional[frozenset]] = None
+    _init_keys: ClassVar[Optional[frozenset]] = None
+    _fast_init: ClassVar[Optional[Callable]] = None
+    _fast_init_args: ClassVar[tuple[str, ...]] = ()
+    """Arguments `from_dict` passes to the constructor itself, rather than taking them from the data"""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # attrs only adds the fields once the class exists, so the keys are computed on first use.
+        # Every class gets its own slot, otherwise a subclass would inherit its parent's cached keys
+        cls._keys = None
+        cls._init_keys = None
+        cls._fast_init = None
+
     @classmethod
     def _get_keys(cls) -> frozenset:
-        if (keys := getattr(cls, "_keys", None)) is None:
-            keys = frozenset(field.name for field in attrs.fields(cls))
-            setattr(cls, "_keys", keys)
+        if (keys := cls._keys) is None:
+            keys = cls._keys = frozenset(field.name for field in attrs.fields(cls))
         return keys
 
     @classmethod
     def _get_init_keys(cls) -> frozenset:
-        if (init_keys := getattr(cls, "_init_keys", None)) is None:
-            init_keys = frozenset(field.name.removeprefix("_") for field in attrs.fields(cls) if field.init)
-            setattr(cls, "_init_keys", init_keys)
+        if (init_keys := cls._init_keys) is None:
+            init_keys = cls._init_keys = frozenset(
+                field.name.removeprefix("_") for field in attrs.fields(cls) if field.init
+            )
         return init_keys
 
+    @classmethod
+    def _get_fast_init(cls) -> Callable:
+        if (fast_init := cls._fast_init) is None:
+            fast_init = cls._fast_init = _generate_fast_init(cls)
+        return fast_init
+
     @classmethod
     def _filter_kwargs(cls, kwargs_dict: dict, keys: frozenset) -> dict:
         if const.kwarg_spam:
@@ -60,11 +145,29 @@ class DictSerializationMixin:
         Returns:
             The object class instance.
 
+        """
+        data = cls._process_dict(data)
+        if const.kwarg_spam:
+            return cls(**cls._filter_kwargs(data, cls._get_init_keys()))
+        return cls._get_fast_init()(data)
+
+    @classmethod
+    def from_dict_safe(cls: Type[const.T], data: Union[Dict[str, Any], const.T]) -> const.T:
+        """
+        Process and converts dictionary data to object class instance, passing existing instances through unchanged.
+
+        Use this where the value may already be an instance, such as attrs converters on user-constructable models.
+
+        Args:
+            data: The json data received from discord api, or an instance of this class.
+
+        Returns:
+            The object class instance.
+
         """
         if isinstance(data, cls):
             return data
-        data = cls._process_dict(data)
-        return cls(**cls._filter_kwargs(data, cls._get_init_keys()))
+        return cls.from_dict(data)
 
     @classmethod
     def from_list(cls: Type[const.T], datas: List[Dict[str, Any]]) -> List[const.T]:
@@ -78,7 +181,8 @@ class DictSerializationMixin:
             List of object class instances.
 
         """
-        return [cls.from_dict(data) for data in datas]
+        from_dict = cls.from_dict
+        return [from_dict(data) for data in datas]
 
     def update_from_dict(self: Type[const.T], data: Dict[str, Any]) -> const.T:
         """
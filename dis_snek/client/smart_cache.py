@@ -1,4 +1,5 @@
 import logging
+import time
 from contextlib import suppress
 from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union
 
@@ -28,6 +29,10 @@ if TYPE_CHECKING:
 
 log = logging.getLogger(logger_name)
 
+# how long, and for how many emoji, a NotFound from fetch_emoji is remembered
+_MISSING_EMOJI_TTL = 60
+_MISSING_EMOJI_LIMIT = 1024
+
 
 def create_cache(
     ttl: Optional[int] = 60, hard_limit: Optional[int] = 250, soft_limit: Absent[Optional[int]] = MISSING
@@ -73,10 +78,12 @@ class GlobalCache:
     enable_emoji_cache: bool = field(default=False)
     """If the emoji cache should be enabled. Default: False"""
     emoji_cache: Optional[dict] = field(default=None, init=False)  # key: emoji_id
+    _missing_emoji: dict = field(factory=dict, init=False)  # (guild_id, emoji_id): (expiry, *NotFound args)
 
     # Expiring id reference cache
     dm_channels: TTLCache = field(factory=TTLCache)  # key: user_id
     user_guilds: TTLCache = field(factory=dict)  # key: user_id; value: set[guild_id]
+    guild_voice_states: dict = field(factory=dict)  # key: guild_id; value: set[user_id]
 
     def __attrs_post_init__(self) -> None:
         if not isinstance(self.message_cache, TTLCache):
@@ -223,6 +230,48 @@ class GlobalCache:
             guild._member_ids.add(user_id)  # noqa
         return member
 
+    def place_member_data_bulk(
+        self, guild_id: "Snowflake_Type", data: List[discord_typings.resources.guild.GuildMemberData]
+    ) -> List[Member]:
+        """
+        Take json data representing many members of a single guild, process it, and cache it.
+
+        Behaves like `place_member_data` for each member, but only resolves the guild and caches once.
+
+        Args:
+            guild_id: The ID of the guild these members belong to
+            data: json representations of the members
+
+        Returns:
+            The processed members
+        """
+        guild_id = to_snowflake(guild_id)
+        member_cache = self.member_cache
+        place_user_guild = self.place_user_guild
+        client = self._client
+        from_dict = Member.from_dict
+
+        guild = self.guild_cache.get(guild_id)
+        guild_member_ids = guild._member_ids if guild else None  # noqa
+
+        members = []
+        for member_data in data:
+            user_id = to_snowflake(member_data["user"]["id"] if "user" in member_data else member_data["id"])
+
+            member = member_cache.get((guild_id, user_id))
+            if member is None:
+                (member_data["member"] if "member" in member_data else member_data)["guild_id"] = guild_id
+                member = from_dict(member_data, client)
+                member_cache[(guild_id, user_id)] = member
+            else:
+                member.update_from_dict(member_data)
+            members.append(member)
+            place_user_guild(user_id, guild_id)
+
+            if guild_member_ids is not None:
+                guild_member_ids.add(user_id)
+        return members
+
     def delete_member(self, guild_id: "Snowflake_Type", user_id: "Snowflake_Type") -> None:
         """
         Delete a member from the cache.
@@ -615,7 +664,9 @@ class GlobalCache:
         Args:
             guild_id: The ID of the guild
         """
-        guild = self.guild_cache.pop(to_snowflake(guild_id), None)
+        guild_id = to_snowflake(guild_id)
+        guild = self.guild_cache.pop(guild_id, None)
+        self.guild_voice_states.pop(guild_id, None)
 
         if guild:
             # delete associated objects
@@ -679,22 +730,37 @@ class GlobalCache:
             The processed role
         """
         guild_id = to_snowflake(guild_id)
+        place_single_role_data = self.place_single_role_data
 
         roles: Dict["Snowflake_Type", Role] = {}
         for role_data in data:  # todo not update cache expiration order for roles
-            role_data.update({"guild_id": guild_id})
-            role_id = to_snowflake(role_data["id"])
+            role = place_single_role_data(guild_id, role_data)
+            roles[role.id] = role
 
-            role = self.role_cache.get(role_id)
-            if role is None:
-                role = Role.from_dict(role_data, self._client)
-                self.role_cache[role_id] = role
-            else:
-                role.update_from_dict(role_data)
+        return roles
 
-            roles[role_id] = role
+    def place_single_role_data(self, guild_id: "Snowflake_Type", data: Dict["Snowflake_Type", Any]) -> Role:
+        """
+        Take json data representing a single role, process it, and cache it.
 
-        return roles
+        Args:
+            guild_id: The ID of the guild this role belongs to
+            data: json representation of the role
+
+        Returns:
+            The processed role
+        """
+        data["guild_id"] = to_snowflake(guild_id)
+        role_id = to_snowflake(data["id"])
+
+        role = self.role_cache.get(role_id)
+        if role is None:
+            role = Role.from_dict(data, self._client)
+            self.role_cache[role_id] = role
+        else:
+            role.update_from_dict(data)
+
+        return role
 
     def delete_role(self, role_id: "Snowflake_Type") -> None:
         """
@@ -744,6 +810,7 @@ class GlobalCache:
             if user_id in old_state.channel._voice_member_ids:
                 # noinspection PyProtectedMember
                 old_state.channel._voice_member_ids.remove(user_id)
+            self._remove_guild_voice_state(old_state, user_id)
 
         # check if the channel_id is None
         # if that is the case, the user disconnected, and we can delete them from the cache
@@ -761,9 +828,25 @@ class GlobalCache:
 
             voice_state = VoiceState.from_dict(data, self._client)
             self.voice_state_cache[user_id] = voice_state
+            # noinspection PyProtectedMember
+            self.guild_voice_states.setdefault(voice_state._guild_id, set()).add(user_id)
 
         return voice_state
 
+    async def place_voice_state_data_bulk(self, data: List[discord_typings.VoiceStateData]) -> None:
+        """
+        Take json data representing many VoiceStates, process it, and cache it.
+
+        Args:
+            data: json representations of the VoiceStates
+        """
+        for state in data:
+            try:
+                await self.place_voice_state_data(state)
+            except Exception as e:
+                # one bad state shouldn't stop the rest from being cached
+                log.error(f"Failed to cache voice state for user {state.get('user_id')}: {e!r}")
+
     def delete_voice_state(self, user_id: "Snowflake_Type") -> None:
         """
         Delete a voice state from the cache.
@@ -771,7 +854,18 @@ class GlobalCache:
         Args:
             user_id: The ID of the user
         """
-        self.voice_state_cache.pop(to_snowflake(user_id), None)
+        user_id = to_snowflake(user_id)
+        if voice_state := self.voice_state_cache.pop(user_id, None):
+            self._remove_guild_voice_state(voice_state, user_id)
+
+    def _remove_guild_voice_state(self, voice_state: VoiceState, user_id: int) -> None:
+        """Remove a user from the per-guild voice state index."""
+        # noinspection PyProtectedMember
+        if user_ids := self.guild_voice_states.get(voice_state._guild_id):
+            user_ids.discard(user_id)
+            if not user_ids:
+                # noinspection PyProtectedMember
+                del self.guild_voice_states[voice_state._guild_id]
 
     # endregion Voice cache
 
@@ -833,7 +927,22 @@ class GlobalCache:
         emoji_id = to_snowflake(emoji_id)
         emoji = self.emoji_cache.get(emoji_id) if self.emoji_cache is not None else None
         if emoji is None:
-            data = await self._client.http.get_guild_emoji(guild_id, emoji_id)
+            key = (guild_id, emoji_id)
+            if (missing := self._missing_emoji.get(key)) is not None:
+                expiry, response, text, code, route = missing
+                if expiry > time.monotonic():
+                    # recently confirmed missing, don't ask the api again
+                    raise NotFound(response, text, code, route=route)
+                del self._missing_emoji[key]
+
+            try:
+                data = await self._client.http.get_guild_emoji(guild_id, emoji_id)
+            except NotFound as e:
+                if len(self._missing_emoji) >= _MISSING_EMOJI_LIMIT:
+                    del self._missing_emoji[next(iter(self._missing_emoji))]
+                # keep what's needed to rebuild the error, not the error itself and the traceback it drags along
+                self._missing_emoji[key] = (time.monotonic() + _MISSING_EMOJI_TTL, e.response, e.text, e.code, e.route)
+                raise
             emoji = self.place_emoji_data(guild_id, data)
 
         return emoji
@@ -872,6 +981,35 @@ class GlobalCache:
 
         return emoji
 
+    def place_emoji_data_bulk(
+        self, guild_id: "Snowflake_Type", data: List[discord_typings.EmojiData]
+    ) -> List["CustomEmoji"]:
+        """
+        Take json data representing many emoji of a single guild, process it, and cache it.
+
+        Behaves like `place_emoji_data` for each emoji, but updates the cache in one go.
+
+        Args:
+            guild_id: The ID of the guild these emoji belong to
+            data: json representations of the emoji
+
+        Returns:
+            The processed emoji
+        """
+        guild_id = to_snowflake(guild_id)
+        client = self._client
+        from_dict = CustomEmoji.from_dict
+
+        emojis = []
+        for emoji_data in data:
+            emoji_data.pop("guild_id", None)  # discord sometimes packages a guild_id - this will cause an exception
+            emojis.append(from_dict(emoji_data, client, guild_id))
+
+        if self.emoji_cache is not None:
+            self.emoji_cache.update({emoji.id: emoji for emoji in emojis})
+
+        return emojis
+
     def delete_emoji(self, emoji_id: "Snowflake_Type") -> None:
         """
         Delete an emoji from the cache.
@@ -9,6 +9,10 @@ if TYPE_CHECKING:
 
 __all__ = ("deserialize_app_cmds",)
 
+_CMD_MAPPING: dict[CommandTypes, type["InteractionCommand"]] = {}
+"""Command type -> command class. Filled on first use, `models.snek` is not importable when this module loads"""
+_OPTIONAL_CMD_KEYS = ("application_id", "default_member_permissions", "dm_permission")
+
 
 def deserialize_app_cmds(data: list[dict]) -> list["InteractionCommand"]:
     """
@@ -21,31 +25,37 @@ def deserialize_app_cmds(data: list[dict]) -> list["InteractionCommand"]:
         A list of interaction command objects
     """
     out = []
-    command_mapping = {
-        CommandTypes.CHAT_INPUT: models.snek.SlashCommand,
-        CommandTypes.USER: models.snek.ContextMenu,
-        CommandTypes.MESSAGE: models.snek.ContextMenu,
-    }
+    if not _CMD_MAPPING:
+        _CMD_MAPPING.update(
+            {
+                CommandTypes.CHAT_INPUT: models.snek.SlashCommand,
+                CommandTypes.USER: models.snek.ContextMenu,
+                CommandTypes.MESSAGE: models.snek.ContextMenu,
+            }
+        )
 
     for cmd_dict in data:
-        options = cmd_dict.pop("options", [])
+        options = cmd_dict.get("options")
         cmd_type = cmd_dict["type"]
 
+        kwargs = {
+            "cmd_id": cmd_dict["id"],
+            "scopes": [cmd_dict.get("guild_id", const.GLOBAL_SCOPE)],
+            "name": cmd_dict["name"],
+        }
         if cmd_type == CommandTypes.CHAT_INPUT:
-            del cmd_dict["type"]
+            kwargs["description"] = cmd_dict["description"]
         else:
-            del cmd_dict["description"]
-
-        cmd_dict["cmd_id"] = cmd_dict.pop("id")
-        cmd_dict["scopes"] = [cmd_dict.pop("guild_id", const.GLOBAL_SCOPE)]
+            kwargs["type"] = cmd_type
+        for key in _OPTIONAL_CMD_KEYS:
+            if key in cmd_dict:
+                kwargs[key] = cmd_dict[key]
 
-        del cmd_dict["version"]
-        del cmd_dict["default_permission"]
-        cmd = command_mapping[cmd_type](**cmd_dict)  # type: ignore
+        cmd = _CMD_MAPPING[cmd_type](**kwargs)  # type: ignore
 
         if options:
-            if subcommands := deserialize_subcommands(cmd, options):
-                out += subcommands
+            found = len(out)
+            if len(deserialize_subcommands(cmd, options, out=out)) > found:
                 continue
             cmd.options = deserialize_options(options)
 
@@ -54,7 +64,10 @@ def deserialize_app_cmds(data: list[dict]) -> list["InteractionCommand"]:
 
 
 def deserialize_subcommands(
-    base_cmd: "SlashCommand", options: list[dict], parent_group: dict | None = None
+    base_cmd: "SlashCommand",
+    options: list[dict],
+    parent_group: dict | None = None,
+    out: list["SlashCommand"] | None = None,
 ) -> list["SlashCommand"]:
     """
     Deserializes subcommands.
@@ -63,19 +76,26 @@ def deserialize_subcommands(
         base_cmd: The subcommands base command
         options: The options from the parent
         parent_group: The parent group, if any
+        out: A list to append the subcommands to, rather than creating a new one
 
     Returns:
         A list of slashcommand (subcommand) objects
     """
-    out = []
+    sub_command_group = int(models.snek.OptionTypes.SUB_COMMAND_GROUP)
+    sub_command = int(models.snek.OptionTypes.SUB_COMMAND)
+    slash_command_cls = models.snek.SlashCommand
+
+    if out is None:
+        out = []
     for opt in options:
-        if opt["type"] == models.snek.OptionTypes.SUB_COMMAND_GROUP:
-            out += deserialize_subcommands(
-                base_cmd, opt["options"], {"name": opt["name"], "description": opt["description"]}
+        opt_type = opt["type"]
+        if opt_type == sub_command_group:
+            deserialize_subcommands(
+                base_cmd, opt["options"], {"name": opt["name"], "description": opt["description"]}, out=out
             )
-        elif opt["type"] == models.snek.OptionTypes.SUB_COMMAND:
+        elif opt_type == sub_command:
             out.append(
-                models.snek.SlashCommand(
+                slash_command_cls(
                     name=base_cmd.name,
                     description=base_cmd.description,
                     group_name=parent_group["name"] if parent_group else None,
@@ -101,8 +121,6 @@ def deserialize_options(options: list[dict]) -> list["SlashCommandOption"]:
     Returns:
         list of SlashCommandOption objects
     """
-    return [
-        models.snek.SlashCommandOption(**opt)
-        for opt in options
-        if opt["type"] not in (models.snek.OptionTypes.SUB_COMMAND_GROUP, models.snek.OptionTypes.SUB_COMMAND)
-    ]
+    option_cls = models.snek.SlashCommandOption
+    subcommand_types = (int(models.snek.OptionTypes.SUB_COMMAND_GROUP), int(models.snek.OptionTypes.SUB_COMMAND))
+    return [option_cls(**opt) for opt in options if opt["type"] not in subcommand_types]
@@ -69,11 +69,10 @@ async def response_decode(response: aiohttp.ClientResponse) -> Union[Dict[str, A
         the response text field in its correct type
 
     """
-    text = await response.text(encoding="utf-8")
-
     if response.headers.get("content-type") == "application/json":
-        return OverriddenJson.loads(text)
-    return text
+        # both json libraries parse the raw bytes, skipping a round trip through str
+        return OverriddenJson.loads(await response.read())
+    return await response.text(encoding="utf-8")
 
 
 def get_args(text: str) -> list:
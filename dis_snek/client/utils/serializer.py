@@ -2,7 +2,7 @@ from base64 import b64encode
 from datetime import datetime, timezone
 from io import IOBase
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, Optional
 
 from attr import fields, has
 
@@ -33,26 +33,50 @@ def to_dict(inst) -> dict:
     if (converter := getattr(inst, "as_dict", None)) is not None:
         return converter()
 
-    attrs = fields(inst.__class__)
-    d = {}
+    cls = inst.__class__
+    if (exporter := _exporters.get(cls)) is None:
+        exporter = _exporters[cls] = _generate_exporter(cls)
+    return exporter(inst)
+
+
+_exporters: Dict[type, Callable] = {}
 
-    for a in attrs:
-        if a.metadata.get("no_export", False):
-            continue
 
-        raw_value = getattr(inst, a.name)
-        if raw_value is MISSING:
+def _generate_exporter(cls: type) -> Callable:
+    """
+    Generate a function that exports instances of `cls`, with the field loop of `to_dict` unrolled.
+
+    Field metadata is read once here, rather than on every export.
+
+    Args:
+        cls: The attrs class to generate the function for
+
+    Returns:
+        The generated function, taking the instance to export
+
+    """
+    namespace = {"MISSING": MISSING, "_to_dict_any": _to_dict_any}
+    lines = ["def export(inst):", "    d = {}"]
+
+    for i, a in enumerate(fields(cls)):
+        if a.metadata.get("no_export", False):
             continue
 
         if (c := a.metadata.get("export_converter", None)) is not None:
-            value = c(raw_value)
+            namespace[f"_converter_{i}"] = c
+            convert = f"_converter_{i}"
         else:
-            value = _to_dict_any(raw_value)
+            convert = "_to_dict_any"
+
+        lines.append(f"    if (value := inst.{a.name}) is not MISSING:")
+        lines.append(f"        value = {convert}(value)")
+        lines.append("        if isinstance(value, (bool, int)) or value:")
+        lines.append(f"            d[{a.name!r}] = value")
 
-        if isinstance(value, (bool, int)) or value:
-            d[a.name] = value
+    lines.append("    return d")
 
-    return d
+    exec("\n".join(lines), namespace)  # noqa: S102
+    return namespace["export"]
 
 
 def _to_dict_any(inst: T) -> dict | list | str | T:
@@ -2,6 +2,7 @@ import io
 import textwrap
 import traceback
 from contextlib import redirect_stdout
+from types import CodeType
 from typing import Any, Optional
 
 from dis_snek import (
@@ -27,6 +28,7 @@ __all__ = ("DebugExec",)
 class DebugExec(Scale):
     def __init__(self, bot) -> None:
         self.cache: dict[int, str] = {}
+        self._code_cache: dict[str, CodeType] = {}
 
     @slash_command("debug", sub_cmd_name="exec", sub_cmd_description="Run arbitrary code")
     async def debug_exec(self, ctx: InteractionContext) -> Optional[Message]:
@@ -59,7 +61,10 @@ class DebugExec(Scale):
         self.cache[ctx.author.id] = body
 
         if body.startswith("```") and body.endswith("```"):
-            body = "\n".join(body.split("\n")[1:-1])
+            # drop the opening and closing fence lines
+            start = body.find("\n") + 1
+            end = body.rfind("\n")
+            body = body[start:end] if end > start else ""
         else:
             body = body.strip("` \n")
 
@@ -67,7 +72,13 @@ class DebugExec(Scale):
 
         to_compile = "async def func():\n%s" % textwrap.indent(body, "  ")
         try:
-            exec(to_compile, env)  # noqa: S102
+            code = self._code_cache.get(to_compile)
+            if code is None:
+                code = compile(to_compile, "<debug-exec>", "exec")
+                if len(self._code_cache) >= 128:
+                    self._code_cache.clear()
+                self._code_cache[to_compile] = code
+            exec(code, env)  # noqa: S102
         except SyntaxError:
             return await ctx.send(f"```py\n{traceback.format_exc()}\n```")
 
@@ -1,7 +1,8 @@
 import datetime
-import inspect
 from typing import TYPE_CHECKING, Any, Optional, Union
 
+import attrs
+
 from dis_snek.client.utils.cache import TTLCache
 from dis_snek.models import Embed, MaterialColors
 
@@ -11,33 +12,28 @@ if TYPE_CHECKING:
 __all__ = ("debug_embed", "get_cache_state", "strf_delta")
 
 
+_DEBUG_URL = "https://github.com/Discord-Snake-Pit/Dis-Snek/tree/master/dis_snek/ext/debug_scale"
+_DEBUG_COLOR = MaterialColors.BLUE_GREY
+_DEBUG_FOOTER_TEXT = "Dis-Snek Debug Scale"
+_DEBUG_FOOTER_ICON = "https://media.discordapp.net/attachments/907639005070377020/918600896433238097/sparkle-snekCUnetnoise_scaleLevel0x2.500000.png"
+
+
 def debug_embed(title: str, **kwargs) -> Embed:
     """Create a debug embed with a standard header and footer."""
-    e = Embed(
-        f"Dis-Snek Debug: {title}",
-        url="https://github.com/Discord-Snake-Pit/Dis-Snek/tree/master/dis_snek/ext/debug_scale",
-        color=MaterialColors.BLUE_GREY,
-        **kwargs,
-    )
-    e.set_footer(
-        "Dis-Snek Debug Scale",
-        icon_url="https://media.discordapp.net/attachments/907639005070377020/918600896433238097/sparkle-snekCUnetnoise_scaleLevel0x2.500000.png",
-    )
+    e = Embed(f"Dis-Snek Debug: {title}", url=_DEBUG_URL, color=_DEBUG_COLOR, **kwargs)
+    e.set_footer(_DEBUG_FOOTER_TEXT, icon_url=_DEBUG_FOOTER_ICON)
     return e
 
 
 def get_cache_state(bot: "Snake") -> str:
     """Create a nicely formatted table of internal cache state."""
+    # the cache is a slotted attrs class, walking its fields avoids `dir()`'s resolve-and-sort of every attribute
     caches = [
-        c[0]
-        for c in inspect.getmembers(bot.cache, predicate=lambda x: isinstance(x, dict))
-        if not c[0].startswith("__")
+        (a.name, val) for a in attrs.fields(type(bot.cache)) if isinstance(val := getattr(bot.cache, a.name), dict)
     ]
     table = []
 
-    for cache in caches:
-        val = getattr(bot.cache, cache)
-
+    for cache, val in caches:
         if isinstance(val, TTLCache):
             amount = [len(val), f"{val.hard_limit}({val.soft_limit})"]
             expire = f"{val.ttl}s"
@@ -61,24 +57,28 @@ def get_cache_state(bot: "Snake") -> str:
 def strf_delta(time_delta: datetime.timedelta, show_seconds: bool = True) -> str:
     """Formats timedelta into a human readable string."""
     years, days = divmod(time_delta.days, 365)
-    hours, rem = divmod(time_delta.seconds, 3600)
-    minutes, seconds = divmod(rem, 60)
-
-    years_fmt = f"{years} year{'s' if years > 1 or years == 0 else ''}"
-    days_fmt = f"{days} day{'s' if days > 1 or days == 0 else ''}"
-    hours_fmt = f"{hours} hour{'s' if hours > 1 or hours == 0 else ''}"
-    minutes_fmt = f"{minutes} minute{'s' if minutes > 1 or minutes == 0 else ''}"
-    seconds_fmt = f"{seconds} second{'s' if seconds > 1 or seconds == 0 else ''}"
-
     if years >= 1:
-        return f"{years_fmt} and {days_fmt}"
+        return f"{_plural(years, 'year')} and {_plural(days, 'day')}"
+
+    hours, rem = divmod(time_delta.seconds, 3600)
     if days >= 1:
-        return f"{days_fmt} and {hours_fmt}"
+        return f"{_plural(days, 'day')} and {_plural(hours, 'hour')}"
+
+    minutes, seconds = divmod(rem, 60)
     if hours >= 1:
-        return f"{hours_fmt} and {minutes_fmt}"
+        return f"{_plural(hours, 'hour')} and {_plural(minutes, 'minute')}"
     if show_seconds:
-        return f"{minutes_fmt} and {seconds_fmt}"
-    return f"{minutes_fmt}"
+        return f"{_plural(minutes, 'minute')} and {_plural(seconds, 'second')}"
+    return _plural(minutes, "minute")
+
+
+def _plural(amount: int, unit: str) -> str:
+    """
+    Internal helper function.
+
+    Formats an amount of a unit, pluralising the unit for anything but 1
+    """
+    return f"{amount} {unit}" if amount == 1 else f"{amount} {unit}s"
 
 
 def _make_solid_line(
@@ -111,8 +111,8 @@ def _make_data_line(
     if isinstance(aligns, str):
         aligns = [aligns for _ in column_widths]
 
-    line = (f"{str(value): {align}{width}}" for width, align, value in zip(column_widths, aligns, line))
-    return f"{left_char}{f'{middle_char}'.join(line)}{right_char}"
+    cells = [format(str(value), f"{align}{width}") for width, align, value in zip(column_widths, aligns, line)]
+    return f"{left_char}{middle_char.join(cells)}{right_char}"
 
 
 def _get_column_widths(columns) -> list[int]:
@@ -121,21 +121,21 @@ def _get_column_widths(columns) -> list[int]:
 
     Calculates max width of each column
     """
-    return [max(len(str(value)) for value in column) for column in columns]
+    return [max([len(value) if type(value) is str else len(str(value)) for value in column]) for column in columns]
 
 
 def adjust_subcolumn(
     rows: list[list[Any]], column_index: int, separator: str = "/", aligns: Union[list[str], str] = "<"
 ) -> None:
     """Converts column composed of list of subcolumns into aligned str representation."""
-    column = list(zip(*rows))[column_index]
+    column = [row[column_index] for row in rows]
     subcolumn_widths = _get_column_widths(zip(*column))
     if isinstance(aligns, str):
         aligns = [aligns for _ in subcolumn_widths]
 
-    column = [_make_data_line(subcolumn_widths, row, "", separator, "", aligns) for row in column]
-    for row, new_item in zip(rows, column):
-        row[column_index] = new_item
+    template = separator.join(f"{{!s: {align}{width}}}" for align, width in zip(aligns, subcolumn_widths))
+    for row, item in zip(rows, column):
+        row[column_index] = template.format(*item)
 
 
 def make_table(rows: list[list[Any]], labels: Optional[list[Any]] = None, centered: bool = False) -> str:
@@ -150,17 +150,16 @@ def make_table(rows: list[list[Any]], labels: Optional[list[Any]] = None, center
     columns = zip(*rows) if labels is None else zip(*rows, labels)
     column_widths = _get_column_widths(columns)
     align = "^" if centered else "<"
-    align = [align for _ in column_widths]
-
-    lines = [_make_solid_line(column_widths, "╭", "┬", "╮")]
 
     data_left = "│ "
     data_middle = " │ "
     data_right = " │"
+    row_template = data_left + data_middle.join(f"{{!s: {align}{width}}}" for width in column_widths) + data_right
+
+    lines = [_make_solid_line(column_widths, "╭", "┬", "╮")]
     if labels is not None:
-        lines.append(_make_data_line(column_widths, labels, data_left, data_middle, data_right, align))
+        lines.append(row_template.format(*labels))
         lines.append(_make_solid_line(column_widths, "├", "┼", "┤"))
-    for row in rows:
-        lines.append(_make_data_line(column_widths, row, data_left, data_middle, data_right, align))
+    lines.extend(row_template.format(*row) for row in rows)
     lines.append(_make_solid_line(column_widths, "╰", "┴", "╯"))
     return "\n".join(lines)
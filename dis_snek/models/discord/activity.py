@@ -68,7 +68,9 @@ class Activity(DictSerializationMixin):
     """Stream url, is validated when type is 1"""
     created_at: Optional[Timestamp] = field(repr=True, default=None, converter=optional(timestamp_converter))
     """When the activity was added to the user's session"""
-    timestamps: Optional[ActivityTimestamps] = field(default=None, converter=optional(ActivityTimestamps.from_dict))
+    timestamps: Optional[ActivityTimestamps] = field(
+        default=None, converter=optional(ActivityTimestamps.from_dict_safe)
+    )
     """Start and/or end of the game"""
     application_id: "Snowflake_Type" = field(default=None)
     """Application id for the game"""
@@ -76,13 +78,13 @@ class Activity(DictSerializationMixin):
     """What the player is currently doing"""
     state: Optional[str] = field(default=None)
     """The user's current party status"""
-    emoji: Optional[PartialEmoji] = field(default=None, converter=optional(PartialEmoji.from_dict))
+    emoji: Optional[PartialEmoji] = field(default=None, converter=optional(PartialEmoji.from_dict_safe))
     """The emoji used for a custom status"""
-    party: Optional[ActivityParty] = field(default=None, converter=optional(ActivityParty.from_dict))
+    party: Optional[ActivityParty] = field(default=None, converter=optional(ActivityParty.from_dict_safe))
     """Information for the current party of the player"""
-    assets: Optional[ActivityAssets] = field(default=None, converter=optional(ActivityAssets.from_dict))
+    assets: Optional[ActivityAssets] = field(default=None, converter=optional(ActivityAssets.from_dict_safe))
     """Assets to display on the player's profile"""
-    secrets: Optional[ActivitySecrets] = field(default=None, converter=optional(ActivitySecrets.from_dict))
+    secrets: Optional[ActivitySecrets] = field(default=None, converter=optional(ActivitySecrets.from_dict_safe))
     """Secrets for Rich Presence joining and spectating"""
     instance: Optional[bool] = field(default=False)
     """Whether or not the activity is an instanced game session"""
@@ -1,10 +1,11 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Type
+from typing import TYPE_CHECKING, Any, ClassVar, Dict, List, Type, Union
 
+import dis_snek.client.const as const
 from dis_snek.client.const import T
 from dis_snek.client.mixins.serialization import DictSerializationMixin
 from dis_snek.client.utils.attr_utils import define, field
 from dis_snek.client.utils.serializer import no_export_meta
-from dis_snek.models.discord.snowflake import SnowflakeObject
+from dis_snek.models.discord.snowflake import SnowflakeObject, _ObjectSlots
 
 if TYPE_CHECKING:
     from dis_snek.client import Snake
@@ -12,12 +13,14 @@ if TYPE_CHECKING:
 __all__ = ("ClientObject", "DiscordObject")
 
 
-@define(slots=False)
-class ClientObject(DictSerializationMixin):
+@define()
+class ClientObject(_ObjectSlots, DictSerializationMixin):
     """Serializable object that requires client reference."""
 
     _client: "Snake" = field(metadata=no_export_meta)
 
+    _fast_init_args: ClassVar[tuple[str, ...]] = ("client",)
+
     @classmethod
     def _process_dict(cls, data: Dict[str, Any], client: "Snake") -> Dict[str, Any]:
         return super()._process_dict(data)
@@ -25,11 +28,20 @@ class ClientObject(DictSerializationMixin):
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any], client: "Snake") -> T:
         data = cls._process_dict(data, client)
-        return cls(client=client, **cls._filter_kwargs(data, cls._get_init_keys()))
+        if const.kwarg_spam:
+            return cls(client=client, **cls._filter_kwargs(data, cls._get_init_keys()))
+        return cls._get_fast_init()(data, client)
+
+    @classmethod
+    def from_dict_safe(cls: Type[T], data: Union[Dict[str, Any], T], client: "Snake") -> T:
+        if isinstance(data, cls):
+            return data
+        return cls.from_dict(data, client)
 
     @classmethod
     def from_list(cls: Type[T], datas: List[Dict[str, Any]], client: "Snake") -> List[T]:
-        return [cls.from_dict(data, client) for data in datas]
+        from_dict = cls.from_dict
+        return [from_dict(data, client) for data in datas]
 
     def update_from_dict(self, data) -> T:
         data = self._process_dict(data, self._client)
@@ -40,6 +52,6 @@ class ClientObject(DictSerializationMixin):
         return self
 
 
-@define(slots=False)
+@define()
 class DiscordObject(SnowflakeObject, ClientObject):
     pass
@@ -13,7 +13,7 @@ from dis_snek.client.const import (
 )
 from dis_snek.client.mixins.serialization import DictSerializationMixin
 from dis_snek.client.utils.attr_utils import define, field
-from dis_snek.client.utils.attr_converters import timestamp_converter
+from dis_snek.client.utils.attr_converters import list_converter, timestamp_converter
 from dis_snek.client.utils.attr_converters import optional as c_optional
 from dis_snek.client.utils.serializer import no_export_meta, export_converter
 from dis_snek.models.discord.color import Color, process_color
@@ -147,7 +147,7 @@ class EmbedFooter(DictSerializationMixin):
         if isinstance(ingest, str):
             return cls(text=ingest)
         else:
-            return cls.from_dict(ingest)
+            return cls.from_dict_safe(ingest)
 
     def __len__(self) -> int:
         return len(self.text)
@@ -192,22 +192,22 @@ class Embed(DictSerializationMixin):
         repr=True,
     )
     """Timestamp of embed content"""
-    fields: List[EmbedField] = field(factory=list, converter=EmbedField.from_list, repr=True)
+    fields: List[EmbedField] = field(factory=list, converter=list_converter(EmbedField.from_dict_safe), repr=True)
     """A list of [fields][dis_snek.models.discord_objects.embed.EmbedField] to go in the embed"""
-    author: Optional[EmbedAuthor] = field(default=None, converter=c_optional(EmbedAuthor.from_dict))
+    author: Optional[EmbedAuthor] = field(default=None, converter=c_optional(EmbedAuthor.from_dict_safe))
     """The author of the embed"""
-    thumbnail: Optional[EmbedAttachment] = field(default=None, converter=c_optional(EmbedAttachment.from_dict))
+    thumbnail: Optional[EmbedAttachment] = field(default=None, converter=c_optional(EmbedAttachment.from_dict_safe))
     """The thumbnail of the embed"""
-    image: Optional[EmbedAttachment] = field(default=None, converter=c_optional(EmbedAttachment.from_dict))
+    image: Optional[EmbedAttachment] = field(default=None, converter=c_optional(EmbedAttachment.from_dict_safe))
     """The image of the embed"""
     video: Optional[EmbedAttachment] = field(
-        default=None, converter=c_optional(EmbedAttachment.from_dict), metadata=no_export_meta
+        default=None, converter=c_optional(EmbedAttachment.from_dict_safe), metadata=no_export_meta
     )
     """The video of the embed, only used by system embeds"""
     footer: Optional[EmbedFooter] = field(default=None, converter=c_optional(EmbedFooter.converter))
     """The footer of the embed"""
     provider: Optional[EmbedProvider] = field(
-        default=None, converter=c_optional(EmbedProvider.from_dict), metadata=no_export_meta
+        default=None, converter=c_optional(EmbedProvider.from_dict_safe), metadata=no_export_meta
     )
     """The provider of the embed, only used for system embeds"""
 
@@ -1,5 +1,6 @@
 import re
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Union
 
 from dis_snek.client.mixins.serialization import DictSerializationMixin
 from dis_snek.client.utils.attr_utils import define, field
@@ -17,7 +18,42 @@ if TYPE_CHECKING:
 
 __all__ = ("PartialEmoji", "CustomEmoji", "process_emoji_req_format", "process_emoji")
 
-emoji_regex = re.compile(r"<?(a)?:(\w*):(\d*)>?")
+try:
+    # re2 is an optional, non-backtracking drop-in. discord restricts custom emoji names to ascii word characters,
+    # so its ascii-only `\w` matches the same strings as `re`'s
+    import re2 as _re
+except ImportError:
+    _re = re
+
+emoji_regex = _re.compile(r"<?(a)?:(\w+):(\d+)>?")
+
+
+@lru_cache(maxsize=1024)
+def _parse_emoji_str(emoji_str: str) -> tuple[str, Optional[str], bool]:
+    """Parse an emoji string into a `(name, id, animated)` tuple. Cached, as the same few emoji are parsed constantly."""
+    if ":" not in emoji_str:
+        # unicode emoji, no need to involve the regex
+        return emoji_str, None, False
+
+    parsed = emoji_regex.fullmatch(emoji_str)
+    if parsed:
+        animated, name, emoji_id = parsed.groups()
+        return name, emoji_id, bool(animated)
+    return emoji_str, None, False
+
+
+def _emoji_str_to_dict(emoji_str: str) -> dict:
+    """Build the api payload for an emoji string, without the PartialEmoji round trip."""
+    name, emoji_id, animated = _parse_emoji_str(emoji_str)
+    if emoji_id:
+        return {"id": int(emoji_id), "name": name, "animated": animated}
+    return {"name": name, "animated": animated}
+
+
+@lru_cache(maxsize=1024)
+def _emoji_str_req_format(emoji_str: str) -> str:
+    name, emoji_id, _ = _parse_emoji_str(emoji_str)
+    return f"{name}:{emoji_id}" if emoji_id else name
 
 
 @define(kw_only=False)
@@ -55,14 +91,8 @@ class PartialEmoji(SnowflakeObject, DictSerializationMixin):
             ValueError if the string cannot be parsed
 
         """
-        parsed = emoji_regex.findall(emoji_str)
-        if parsed:
-            if len(parsed[0]) == 3:
-                return cls(name=parsed[0][1], id=parsed[0][2], animated=True)
-            else:
-                return cls(name=parsed[0][0], id=parsed[0][1])
-        else:
-            return cls(name=emoji_str)
+        name, emoji_id, animated = _parse_emoji_str(emoji_str)
+        return cls(name=name, id=emoji_id, animated=animated)
 
     def __str__(self) -> str:
         s = self.req_format
@@ -71,12 +101,17 @@ class PartialEmoji(SnowflakeObject, DictSerializationMixin):
         return s
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True
         if not isinstance(other, PartialEmoji):
             return False
-        if self.id:
-            return self.id == other.id
+        if emoji_id := self.id:
+            return emoji_id == other.id
         return self.name == other.name
 
+    def __hash__(self) -> int:
+        return hash(self.id) if self.id else hash(self.name)
+
     @property
     def req_format(self) -> str:
         """Format used for web request."""
@@ -133,7 +168,14 @@ class CustomEmoji(PartialEmoji):
     @property
     def roles(self) -> List["Role"]:
         """The roles allowed to use this emoji."""
-        return [self._client.cache.get_role(role_id) for role_id in self._role_ids]
+        return list(self.iter_roles())
+
+    def iter_roles(self) -> Iterator["Role"]:
+        """Lazily yields the roles allowed to use this emoji, skipping any that are not cached."""
+        get_role = self._client.cache.get_role
+        for role_id in self._role_ids:
+            if role := get_role(role_id):
+                yield role
 
     @property
     def is_usable(self) -> bool:
@@ -141,8 +183,7 @@ class CustomEmoji(PartialEmoji):
         if not self.available:
             return False
 
-        guild = self.guild
-        return any(e_role_id in guild.me._role_ids for e_role_id in self._role_ids)
+        return not set(self.guild.me._role_ids).isdisjoint(self._role_ids)
 
     async def edit(
         self,
@@ -201,15 +242,24 @@ def process_emoji_req_format(emoji: Optional[Union[PartialEmoji, dict, str]]) ->
     if not emoji:
         return emoji
 
-    if isinstance(emoji, str):
-        emoji = PartialEmoji.from_str(emoji)
+    emoji_type = type(emoji)
+    if emoji_type is str:
+        return _emoji_str_req_format(emoji)
 
-    if isinstance(emoji, dict):
-        emoji = PartialEmoji.from_dict(emoji)
+    if emoji_type is dict:
+        # skip building a PartialEmoji just to read two keys back out of it
+        emoji_id = emoji.get("id")
+        return f"{emoji.get('name')}:{emoji_id}" if emoji_id else emoji.get("name")
 
     if isinstance(emoji, PartialEmoji):
         return emoji.req_format
 
+    if isinstance(emoji, str):
+        return _emoji_str_req_format(emoji)
+
+    if isinstance(emoji, dict):
+        return PartialEmoji.from_dict(emoji).req_format
+
     raise ValueError(f"Invalid emoji: {emoji}")
 
 
@@ -227,13 +277,20 @@ def process_emoji(emoji: Optional[Union[PartialEmoji, dict, str]]) -> Optional[d
     if not emoji:
         return emoji
 
-    if isinstance(emoji, dict):
+    emoji_type = type(emoji)
+    if emoji_type is dict:
         return emoji
 
-    if isinstance(emoji, str):
-        emoji = PartialEmoji.from_str(emoji)
+    if emoji_type is str:
+        return _emoji_str_to_dict(emoji)
 
     if isinstance(emoji, PartialEmoji):
         return emoji.to_dict()
 
+    if isinstance(emoji, dict):
+        return emoji
+
+    if isinstance(emoji, str):
+        return _emoji_str_to_dict(emoji)
+
     raise ValueError(f"Invalid emoji: {emoji}")
@@ -1,8 +1,9 @@
 import asyncio
 import logging
+import sys
 import time
 from collections import namedtuple
-from typing import List, Optional, Union, Set, Dict, Any, TYPE_CHECKING
+from typing import List, Optional, Union, Set, Dict, Any, Callable, ClassVar, FrozenSet, TYPE_CHECKING
 
 from aiohttp import FormData
 
@@ -58,6 +59,13 @@ __all__ = (
 log = logging.getLogger(logger_name)
 
 
+def _maybe(func: Callable, value: Any) -> Any:
+    """Applies `func` to `value`, unless it was not passed."""
+    if value is MISSING or value is None:
+        return MISSING
+    return func(value)
+
+
 @define()
 class GuildBan:
     reason: Optional[str]
@@ -79,11 +87,14 @@ class BaseGuild(DiscordObject):
     """Splash image asset"""
     discovery_splash: Optional["models.Asset"] = field(default=None)
     """Discovery splash image. Only present for guilds with the "DISCOVERABLE" feature."""
-    features: List[str] = field(factory=list)
+    features: FrozenSet[str] = field(factory=frozenset, converter=frozenset)
     """The features of this guild"""
 
     @classmethod
     def _process_dict(cls, data: Dict[str, Any], client: "Snake") -> Dict[str, Any]:
+        if features := data.get("features"):
+            # every guild repeats the same handful of feature names, keep one copy of each
+            data["features"] = frozenset(map(sys.intern, features))
         if icon_hash := data.pop("icon", None):
             data["icon"] = models.Asset.from_path_hash(client, f"icons/{data['id']}/{{}}", icon_hash)
         if splash_hash := data.pop("splash", None):
@@ -184,8 +195,7 @@ class Guild(BaseGuild):
     """The guild NSFW level."""
     stage_instances: List[dict] = field(factory=list)  # TODO stage instance objects
     """Stage instances in the guild."""
-    chunked = field(factory=asyncio.Event, metadata=no_export_meta)
-    """An event that is fired when this guild has been chunked"""
+    _chunked: Optional[asyncio.Event] = field(default=None, init=False, metadata=no_export_meta)
 
     _owner_id: Snowflake_Type = field(converter=to_snowflake)
     _channel_ids: Set[Snowflake_Type] = field(factory=set)
@@ -199,29 +209,30 @@ class Guild(BaseGuild):
         # todo: find a away to prevent this loop from blocking the event loop
         data = super()._process_dict(data, client)
         guild_id = data["id"]
+        cache = client.cache
+        place_channel_data = cache.place_channel_data
 
         channels_data = data.pop("channels", [])
         for c in channels_data:
             c["guild_id"] = guild_id
-        data["channel_ids"] = {client.cache.place_channel_data(channel_data).id for channel_data in channels_data}
+        data["channel_ids"] = {place_channel_data(channel_data).id for channel_data in channels_data}
 
         threads_data = data.pop("threads", [])
-        data["thread_ids"] = {client.cache.place_channel_data(thread_data).id for thread_data in threads_data}
+        data["thread_ids"] = {place_channel_data(thread_data).id for thread_data in threads_data}
 
         members_data = data.pop("members", [])
-        data["member_ids"] = {client.cache.place_member_data(guild_id, member_data).id for member_data in members_data}
+        data["member_ids"] = {member.id for member in cache.place_member_data_bulk(guild_id, members_data)}
 
         roles_data = data.pop("roles", [])
-        data["role_ids"] = set(client.cache.place_role_data(guild_id, roles_data).keys())
+        data["role_ids"] = set(cache.place_role_data(guild_id, roles_data).keys())
 
         if welcome_screen := data.get("welcome_screen"):
-            data["welcome_screen"] = GuildWelcome.from_dict(welcome_screen, client)
-
-        if voice_states := data.get("voice_states"):
-            [
-                asyncio.create_task(client.cache.place_voice_state_data(state | {"guild_id": guild_id}))
-                for state in voice_states
-            ]
+            # built directly, this runs for every guild on startup
+            data["welcome_screen"] = GuildWelcome(
+                client=client,
+                description=welcome_screen.get("description"),
+                welcome_channels=GuildWelcomeChannel.from_list(welcome_screen.get("welcome_channels", []), client),
+            )
         return data
 
     @classmethod
@@ -276,7 +287,7 @@ class Guild(BaseGuild):
         """
         data = await client.http.create_guild(
             name=name,
-            icon=to_image_data(icon) if icon else MISSING,
+            icon=_maybe(to_image_data, icon),
             verification_level=verification_level,
             default_message_notifications=default_message_notifications,
             explicit_content_filter=explicit_content_filter,
@@ -285,44 +296,59 @@ class Guild(BaseGuild):
             afk_channel_id=afk_channel_id,
             afk_timeout=afk_timeout,
             system_channel_id=system_channel_id,
-            system_channel_flags=int(system_channel_flags) if system_channel_flags else MISSING,
+            system_channel_flags=_maybe(int, system_channel_flags),
         )
         return client.cache.place_guild_data(data)
 
+    @property
+    def chunked(self) -> asyncio.Event:
+        """An event that is fired when this guild has been chunked"""
+        # created on first use, most guilds never have their chunk state looked at
+        if self._chunked is None:
+            self._chunked = asyncio.Event()
+        return self._chunked
+
     @property
     def channels(self) -> List["models.TYPE_GUILD_CHANNEL"]:
         """Returns a list of channels associated with this guild."""
-        return [self._client.cache.get_channel(c_id) for c_id in self._channel_ids]
+        get_channel = self._client.cache.get_channel
+        return [get_channel(c_id) for c_id in self._channel_ids]
 
     @property
     def threads(self) -> List["models.TYPE_THREAD_CHANNEL"]:
         """Returns a list of threads associated with this guild."""
-        return [self._client.cache.get_channel(t_id) for t_id in self._thread_ids]
+        get_channel = self._client.cache.get_channel
+        return [get_channel(t_id) for t_id in self._thread_ids]
 
     @property
     def members(self) -> List["models.Member"]:
         """Returns a list of all members within this guild."""
-        return [self._client.cache.get_member(self.id, m_id) for m_id in self._member_ids]
+        get_member, guild_id = self._client.cache.get_member, self.id
+        return [get_member(guild_id, m_id) for m_id in self._member_ids]
 
     @property
     def premium_subscribers(self) -> List["models.Member"]:
         """Returns a list of all premium subscribers"""
-        return [member for member in self.members if member.premium]
+        get_member, guild_id = self._client.cache.get_member, self.id
+        return [member for m_id in self._member_ids if (member := get_member(guild_id, m_id)) and member.premium]
 
     @property
     def bots(self) -> List["models.Member"]:
         """Returns a list of all bots within this guild"""
-        return [member for member in self.members if member.bot]
+        get_member, guild_id = self._client.cache.get_member, self.id
+        return [member for m_id in self._member_ids if (member := get_member(guild_id, m_id)) and member.bot]
 
     @property
     def humans(self) -> List["models.Member"]:
         """Returns a list of all humans within this guild"""
-        return [member for member in self.members if not member.bot]
+        get_member, guild_id = self._client.cache.get_member, self.id
+        return [member for m_id in self._member_ids if (member := get_member(guild_id, m_id)) and not member.bot]
 
     @property
     def roles(self) -> List["models.Role"]:
         """Returns a list of roles associated with this guild."""
-        return [self._client.cache.get_role(r_id) for r_id in self._role_ids]
+        get_role = self._client.cache.get_role
+        return [get_role(r_id) for r_id in self._role_ids]
 
     @property
     def me(self) -> "models.Member":
@@ -344,28 +370,30 @@ class Guild(BaseGuild):
         """Returns the channel where server staff receive notices from Discord."""
         return self._client.cache.get_channel(self.public_updates_channel_id)
 
+    @property
+    def _premium_limits(self) -> dict:
+        """The premium limits for this guild's boost tier."""
+        return PREMIUM_GUILD_LIMITS.get(self.premium_tier, PREMIUM_GUILD_LIMITS[0])
+
     @property
     def emoji_limit(self) -> int:
         """The maximum number of emoji this guild can have."""
-        base = 200 if "MORE_EMOJI" in self.features else 50
-        return max(base, PREMIUM_GUILD_LIMITS[self.premium_tier]["emoji"])
+        return max(200 if "MORE_EMOJI" in self.features else 50, self._premium_limits["emoji"])
 
     @property
     def sticker_limit(self) -> int:
         """The maximum number of stickers this guild can have."""
-        base = 60 if "MORE_STICKERS" in self.features else 0
-        return max(base, PREMIUM_GUILD_LIMITS[self.premium_tier]["stickers"])
+        return max(60 if "MORE_STICKERS" in self.features else 0, self._premium_limits["stickers"])
 
     @property
     def bitrate_limit(self) -> int:
         """The maximum bitrate for this guild."""
-        base = 128000 if "VIP_REGIONS" in self.features else 96000
-        return max(base, PREMIUM_GUILD_LIMITS[self.premium_tier]["bitrate"])
+        return max(128000 if "VIP_REGIONS" in self.features else 96000, self._premium_limits["bitrate"])
 
     @property
     def filesize_limit(self) -> int:
         """The maximum filesize that may be uploaded within this guild."""
-        return PREMIUM_GUILD_LIMITS[self.premium_tier]["filesize"]
+        return self._premium_limits["filesize"]
 
     @property
     def default_role(self) -> "models.Role":
@@ -375,8 +403,9 @@ class Guild(BaseGuild):
     @property
     def premium_subscriber_role(self) -> Optional["models.Role"]:
         """The role given to boosters of this server, if set."""
-        for role in self.roles:
-            if role.premium_subscriber:
+        get_role = self._client.cache.get_role
+        for r_id in self._role_ids:
+            if (role := get_role(r_id)) and role.premium_subscriber:
                 return role
         return None
 
@@ -384,8 +413,9 @@ class Guild(BaseGuild):
     def my_role(self) -> Optional["models.Role"]:
         """The role associated with this client, if set."""
         m_r_id = self._client.user.id
-        for role in self.roles:
-            if role._bot_id == m_r_id:
+        get_role = self._client.cache.get_role
+        for r_id in self._role_ids:
+            if (role := get_role(r_id)) and role._bot_id == m_r_id:
                 return role
         return None
 
@@ -402,10 +432,16 @@ class Guild(BaseGuild):
     @property
     def voice_states(self) -> List["models.VoiceState"]:
         """Get a list of the active voice states in this guild."""
-        # this is *very* ick, but we cache by user_id, so we have to do it this way,
-        # alternative would be maintaining a lookup table in this guild object, which is inherently unreliable
+        # voice states are cached by user_id, the cache keeps a guild_id -> user_ids index alongside.
+        # the states themselves may have expired, so they're still checked against the main cache
+        cache = self._client.cache
+        voice_state_cache = cache.voice_state_cache
         # noinspection PyProtectedMember
-        return [v_state for v_state in self._client.cache.voice_state_cache.values() if v_state._guild_id == self.id]
+        return [
+            v_state
+            for user_id in cache.guild_voice_states.get(self.id, ())
+            if (v_state := voice_state_cache.get(user_id)) and v_state._guild_id == self.id
+        ]
 
     async def fetch_member(self, member_id: Snowflake_Type) -> Optional["models.Member"]:
         """
@@ -465,7 +501,8 @@ class Guild(BaseGuild):
 
         """
         data = await self._client.http.get_guild_channels(self.id)
-        return [self._client.cache.place_channel_data(channel_data) for channel_data in data]
+        place_channel_data = self._client.cache.place_channel_data
+        return [place_channel_data(channel_data) for channel_data in data]
 
     def is_owner(self, user: Snowflake_Type) -> bool:
         """
@@ -523,19 +560,13 @@ class Guild(BaseGuild):
 
         if presences := chunk.get("presences"):
             # combine the presence dict into the members dict
+            members_by_id = {member["user"]["id"]: member for member in chunk["members"]}
             for presence in presences:
-                u_id = presence["user"]["id"]
                 # find the user this presence is for
-                member_index = next(
-                    (index for (index, d) in enumerate(chunk.get("members")) if d["user"]["id"] == u_id), None
-                )
-                del presence["user"]
-                chunk["members"][member_index]["user"] = chunk["members"][member_index]["user"] | presence
-
-        if not self._chunk_cache:
-            self._chunk_cache: List = chunk.get("members")
-        else:
-            self._chunk_cache = self._chunk_cache + chunk.get("members")
+                if member := members_by_id.get(presence.pop("user")["id"]):
+                    member["user"].update(presence)
+
+        self._chunk_cache.extend(chunk["members"])
 
         if chunk.get("chunk_index") != chunk.get("chunk_count") - 1:
             return log.debug(f"Cached chunk of {len(chunk.get('members'))} members for {self.id}")
@@ -543,20 +574,18 @@ class Guild(BaseGuild):
             members = self._chunk_cache
             log.info(f"Processing {len(members)} members for {self.id}")
 
-            s = time.monotonic()
             start_time = time.perf_counter()
+            place_member_data_bulk = self._client.cache.place_member_data_bulk
 
-            for member in members:
-                self._client.cache.place_member_data(self.id, member)
-                if (time.monotonic() - s) > 0.05:
-                    # look, i get this *could* be a thread, but because it needs to modify data in the main thread,
-                    # it is still blocking. So by periodically yielding to the event loop, we can avoid blocking, and still
-                    # process this data properly
-                    await asyncio.sleep(0)
-                    s = time.monotonic()
+            for i in range(0, len(members), 1000):
+                place_member_data_bulk(self.id, members[i : i + 1000])
+                # look, i get this *could* be a thread, but because it needs to modify data in the main thread,
+                # it is still blocking. So by yielding to the event loop between batches, we can avoid blocking, and still
+                # process this data properly
+                await asyncio.sleep(0)
 
             total_time = time.perf_counter() - start_time
-            self.chunk_cache = []
+            self._chunk_cache = []
             log.info(f"Cached members for {self.id} in {total_time:.2f} seconds")
             self.chunked.set()
 
@@ -676,22 +705,20 @@ class Guild(BaseGuild):
             guild_id=self.id,
             name=name,
             description=description,
-            verification_level=int(verification_level) if verification_level else MISSING,
-            default_message_notifications=int(default_message_notifications)
-            if default_message_notifications
-            else MISSING,
-            explicit_content_filter=int(explicit_content_filter) if explicit_content_filter else MISSING,
-            afk_channel_id=to_snowflake(afk_channel) if afk_channel else MISSING,
+            verification_level=_maybe(int, verification_level),
+            default_message_notifications=_maybe(int, default_message_notifications),
+            explicit_content_filter=_maybe(int, explicit_content_filter),
+            afk_channel_id=_maybe(to_snowflake, afk_channel),
             afk_timeout=afk_timeout,
-            icon=to_image_data(icon) if icon else MISSING,
-            owner_id=to_snowflake(owner) if owner else MISSING,
-            splash=to_image_data(splash) if splash else MISSING,
-            discovery_splash=to_image_data(discovery_splash) if discovery_splash else MISSING,
-            banner=to_image_data(banner) if banner else MISSING,
-            system_channel_id=to_snowflake(system_channel) if system_channel else MISSING,
-            system_channel_flags=int(system_channel_flags) if system_channel_flags else MISSING,
-            rules_channel_id=to_snowflake(rules_channel) if rules_channel else MISSING,
-            public_updates_channel_id=to_snowflake(public_updates_channel) if public_updates_channel else MISSING,
+            icon=_maybe(to_image_data, icon),
+            owner_id=_maybe(to_snowflake, owner),
+            splash=_maybe(to_image_data, splash),
+            discovery_splash=_maybe(to_image_data, discovery_splash),
+            banner=_maybe(to_image_data, banner),
+            system_channel_id=_maybe(to_snowflake, system_channel),
+            system_channel_flags=_maybe(int, system_channel_flags),
+            rules_channel_id=_maybe(to_snowflake, rules_channel),
+            public_updates_channel_id=_maybe(to_snowflake, public_updates_channel),
             preferred_locale=preferred_locale,
             features=features,
             reason=reason,
@@ -761,7 +788,7 @@ class Guild(BaseGuild):
 
         """
         emojis_data = await self._client.http.get_all_guild_emoji(self.id)
-        return [self._client.cache.place_emoji_data(self.id, emoji_data) for emoji_data in emojis_data]
+        return self._client.cache.place_emoji_data_bulk(self.id, emojis_data)
 
     async def fetch_custom_emoji(self, emoji_id: Snowflake_Type) -> Optional["models.CustomEmoji"]:
         """
@@ -1060,7 +1087,7 @@ class Guild(BaseGuild):
 
         """
         if isinstance(channel, (str, int)):
-            channel = await self._client.get_channel(channel)
+            channel = await self._client.fetch_channel(channel)
 
         if not channel:
             raise ValueError("Unable to find requested channel")
@@ -1147,7 +1174,8 @@ class Guild(BaseGuild):
 
         """
         if external_location is not MISSING:
-            entity_metadata = {"location": external_location}
+            # merged into a copy, the caller's dict is left untouched
+            entity_metadata = {**(entity_metadata or {}), "location": external_location}
 
         if event_type == ScheduledEventType.EXTERNAL:
             if external_location == MISSING:
@@ -1309,31 +1337,31 @@ class Guild(BaseGuild):
         payload = {}
 
         if name:
-            payload.update({"name": name})
+            payload["name"] = name
 
         if permissions:
-            payload.update({"permissions": str(int(permissions))})
+            payload["permissions"] = str(int(permissions))
 
         colour = colour or color
         if colour:
-            payload.update({"color": colour.value})
+            payload["color"] = colour.value
 
         if hoist:
-            payload.update({"hoist": True})
+            payload["hoist"] = True
 
         if mentionable:
-            payload.update({"mentionable": True})
+            payload["mentionable"] = True
 
         if icon:
             # test if the icon is probably a unicode emoji (str and len() == 1) or a path / bytes obj
             if isinstance(icon, str) and len(icon) == 1:
-                payload.update({"unicode_emoji": icon})
+                payload["unicode_emoji"] = icon
 
             else:
-                payload.update({"icon": to_image_data(icon)})
+                payload["icon"] = to_image_data(icon)
 
         result = await self._client.http.create_guild_role(guild_id=self.id, payload=payload, reason=reason)
-        return self._client.cache.place_role_data(guild_id=self.id, data=[result])[to_snowflake(result["id"])]
+        return self._client.cache.place_single_role_data(guild_id=self.id, data=result)
 
     def get_channel(self, channel_id: Snowflake_Type) -> Optional["models.TYPE_GUILD_CHANNEL"]:
         """
@@ -1366,20 +1394,19 @@ class Guild(BaseGuild):
 
         """
         channel_id = to_snowflake(channel_id)
-        if channel_id in self._channel_ids or not self._client.gateway_started:
-            # The latter check here is to see if the bot is running with the gateway.
-            # If not, then we need to check the API since only the gateway
-            # populates the channel IDs
+        if channel_id not in self._channel_ids and self._client.gateway_started:
+            # only the gateway populates the channel IDs, without it we need to check the API
+            return None
 
-            # theoretically, this could get any channel the client can see,
-            # but to make it less confusing to new programmers,
-            # i intentionally check that the guild contains the channel first
-            try:
-                channel = await self._client.fetch_channel(channel_id)
-                if channel._guild_id == self.id:
-                    return channel
-            except (NotFound, AttributeError):
-                return None
+        # theoretically, this could get any channel the client can see,
+        # but to make it less confusing to new programmers,
+        # i intentionally check that the guild contains the channel first
+        try:
+            channel = await self._client.fetch_channel(channel_id)
+            if channel._guild_id == self.id:
+                return channel
+        except (NotFound, AttributeError):
+            return None
 
         return None
 
@@ -1399,12 +1426,15 @@ class Guild(BaseGuild):
             return self._client.cache.get_channel(thread_id)
         return None
 
-    async def fetch_thread(self, thread_id: Snowflake_Type) -> Optional["models.TYPE_THREAD_CHANNEL"]:
+    async def fetch_thread(
+        self, thread_id: Snowflake_Type, allow_api_miss: bool = False
+    ) -> Optional["models.TYPE_THREAD_CHANNEL"]:
         """
         Returns a Thread with the given `thread_id` from the API.
 
         Args:
             thread_id: The ID of the thread to get
+            allow_api_miss: Fetch the thread even if it is not known to this guild yet, such as a thread that was just created
 
         Returns:
             Thread object if found, otherwise None
@@ -1416,6 +1446,15 @@ class Guild(BaseGuild):
                 return await self._client.fetch_channel(thread_id)
             except NotFound:
                 return None
+
+        if allow_api_miss:
+            try:
+                thread = await self._client.fetch_channel(thread_id)
+                if thread._guild_id == self.id:
+                    return thread
+            except (NotFound, AttributeError):
+                return None
+
         return None
 
     async def prune_members(
@@ -1439,7 +1478,7 @@ class Guild(BaseGuild):
 
         """
         if roles:
-            roles = [str(to_snowflake(r)) for r in roles]
+            roles = list(map(str, map(to_snowflake, roles)))
 
         resp = await self._client.http.begin_guild_prune(
             self.id, days, include_roles=roles, compute_prune_count=compute_prune_count, reason=reason
@@ -1461,7 +1500,8 @@ class Guild(BaseGuild):
 
         """
         if roles is not MISSING:
-            roles = [r.id if isinstance(r, models.Role) else r for r in roles]
+            # the http layer joins these into a query string, so they must be strings
+            roles = list(map(str, map(to_snowflake, roles)))
         else:
             roles = []
 
@@ -1657,7 +1697,9 @@ class Guild(BaseGuild):
 
         """
         data = await self._client.http.get_guild_integrations(self.id)
-        return [GuildIntegration.from_dict(d | {"guild_id": self.id}, self._client) for d in data]
+        for d in data:
+            d["guild_id"] = self.id
+        return GuildIntegration.from_list(data, self._client)
 
     async def search_members(self, query: str, limit: int = 1) -> List["models.Member"]:
         """
@@ -1672,7 +1714,7 @@ class Guild(BaseGuild):
 
         """
         data = await self._client.http.search_guild_members(guild_id=self.id, query=query, limit=limit)
-        return [self._client.cache.place_member_data(self.id, _d) for _d in data]
+        return self._client.cache.place_member_data_bulk(self.id, data)
 
     async def fetch_voice_regions(self) -> List["models.VoiceRegion"]:
         """
@@ -1839,7 +1881,8 @@ class GuildWidget(DiscordObject):
             List of channels
 
         """
-        return [self._client.get_channel(channel_id) for channel_id in self._channel_ids]
+        get_channel = self._client.get_channel
+        return [get_channel(channel_id) for channel_id in self._channel_ids]
 
     async def fetch_channels(self) -> List["models.TYPE_VOICE_CHANNEL"]:
         """
@@ -1859,7 +1902,8 @@ class GuildWidget(DiscordObject):
             List of users
 
         """
-        return [self._client.get_user(member_id) for member_id in self._member_ids]
+        get_user = self._client.get_user
+        return [get_user(member_id) for member_id in self._member_ids]
 
     async def fetch_members(self) -> List["models.User"]:
         """
@@ -1956,6 +2000,9 @@ class AuditLogHistory(AsyncIterator):
 
     """
 
+    _prefetch_at: ClassVar[int] = 10
+    """How many entries may be left in the queue when the next page starts downloading"""
+
     def __init__(
         self,
         guild: "Guild",
@@ -1970,28 +2017,76 @@ class AuditLogHistory(AsyncIterator):
         self.action_type: "AuditLogEventType" = action_type
         self.before: Snowflake_Type = before
         self.after: Snowflake_Type = after
+        self._next_page: Optional[tuple[Snowflake_Type, int]] = None
+        self._prefetch: Optional[asyncio.Task] = None
         super().__init__(limit)
 
+    async def _fetch_page(self, cursor: Snowflake_Type, limit: int) -> List["AuditLogEntry"]:
+        user_id = MISSING if self.user_id is None else self.user_id
+        action_type = MISSING if self.action_type is None else self.action_type
+        if self.after:
+            log = await self.guild.fetch_audit_log(user_id, action_type, after=cursor, limit=limit)
+        else:
+            log = await self.guild.fetch_audit_log(user_id, action_type, before=cursor, limit=limit)
+        return log.entries if log.entries else []
+
     async def fetch(self) -> List["AuditLog"]:
         """
         Retrieves the audit log entries from discord API.
 
+        With a limit set, the next page is requested once this one is nearly consumed, so it downloads while the last
+        few entries are handled.
+
         Returns:
             The list of audit log entries.
 
         """
-        if self.after:
+        limit = self.get_limit
+        if self._prefetch is not None:
+            entries = await self._prefetch
+            self._prefetch = None
+        elif self._next_page is not None:
+            entries = await self._fetch_page(*self._next_page)
+        else:
             if not self.last:
                 self.last = namedtuple("temp", "id")
-                self.last.id = self.after
-            log = await self.guild.fetch_audit_log(limit=self.get_limit, after=self.last.id)
-            entries = log.entries if log.entries else []
+                self.last.id = self.after or self.before
+            entries = await self._fetch_page(self.last.id, limit)
+        self._next_page = None
+
+        # a short page means the log is exhausted, and without a limit there's no telling if another page is wanted
+        if self._limit and len(entries) == limit:
+            remaining = self._limit - len(self._retrieved_objects) - limit
+            if remaining > 0:
+                self._next_page = (entries[-1].id, min(remaining, 100))
+        return entries
 
-        else:
-            if self.before and not self.last:
-                self.last = namedtuple("temp", "id")
-                self.last.id = self.before
+    def _cancel_prefetch(self) -> None:
+        if self._prefetch is not None:
+            if not self._prefetch.cancel() and not self._prefetch.cancelled():
+                # already finished, retrieve any error so it isn't reported as never retrieved
+                self._prefetch.exception()
+            self._prefetch = None
 
-            log = await self.guild.fetch_audit_log(limit=self.get_limit, before=self.last.id)
-            entries = log.entries if log.entries else []
-        return entries
+    async def __anext__(self) -> "AuditLogEntry":
+        try:
+            entry = await super().__anext__()
+        except StopAsyncIteration:
+            self._cancel_prefetch()
+            raise
+
+        # only start on the next page once this one is nearly done, so an abandoned iterator leaves nothing running
+        if self._next_page is not None and self._prefetch is None and self._queue.qsize() <= self._prefetch_at:
+            self._prefetch = asyncio.create_task(self._fetch_page(*self._next_page))
+        return entry
+
+    async def search(self, target_id: "Snowflake_Type") -> bool:
+        try:
+            return await super().search(target_id)
+        finally:
+            # a hit stops iteration part way through a page
+            self._cancel_prefetch()
+
+    async def aclose(self) -> None:
+        """Stop iterating early, dropping any page that is still being fetched."""
+        self._cancel_prefetch()
@@ -12,7 +12,7 @@ from dis_snek.client.utils.attr_utils import define, field
 from dis_snek.client.utils.attr_converters import optional as optional_c
 from dis_snek.client.utils.attr_converters import timestamp_converter
 from dis_snek.client.utils.input_utils import OverriddenJson
-from dis_snek.client.utils.serializer import dict_filter_none
+from dis_snek.client.utils.serializer import dict_filter_none, no_export_meta
 from dis_snek.models.discord.file import UPLOADABLE_TYPE
 from .base import DiscordObject
 from .enums import (
@@ -296,7 +296,7 @@ class Message(BaseMessage):
     application_id: Optional["Snowflake_Type"] = field(default=None, converter=to_optional_snowflake)
     """If the message is an Interaction or application-owned webhook, this is the id of the application"""
     message_reference: Optional[MessageReference] = field(
-        default=None, converter=optional_c(MessageReference.from_dict)
+        default=None, converter=optional_c(MessageReference.from_dict_safe)
     )
     """Data showing the source of a crosspost, channel follow add, pin, or reply message"""
     flags: MessageFlags = field(default=MessageFlags.NONE, converter=MessageFlags)
@@ -310,6 +310,8 @@ class Message(BaseMessage):
     _mention_ids: List["Snowflake_Type"] = field(factory=list)
     _mention_roles: List["Snowflake_Type"] = field(factory=list)
     _referenced_message_id: Optional["Snowflake_Type"] = field(default=None)
+    _reaction_index: Dict[Union[int, str], "models.Reaction"] = field(init=False, factory=dict, metadata=no_export_meta)
+    _indexed_reactions: Optional[List["models.Reaction"]] = field(init=False, default=None, metadata=no_export_meta)
 
     @property
     async def mention_users(self) -> AsyncGenerator["models.Member", None]:
@@ -347,6 +349,13 @@ class Message(BaseMessage):
             return None
         return self._client.cache.get_message(self._channel_id, self._referenced_message_id)
 
+    def _get_reaction_index(self) -> Dict[Union[int, str], "models.Reaction"]:
+        """Get this message's reactions keyed by emoji id, or name for unicode emoji. Rebuilt if `reactions` is replaced."""
+        if self._indexed_reactions is not self.reactions:
+            self._reaction_index = {r.emoji.id or r.emoji.name: r for r in self.reactions}
+            self._indexed_reactions = self.reactions
+        return self._reaction_index
+
     @classmethod
     def _process_dict(cls, data: dict, client: "Snake") -> dict:
         if author_data := data.pop("author", None):
@@ -70,7 +70,7 @@ class Reaction(ClientObject):
     """times this emoji has been used to react"""
     me: bool = field(default=False)
     """whether the current user reacted using this emoji"""
-    emoji: "PartialEmoji" = field(converter=PartialEmoji.from_dict)
+    emoji: "PartialEmoji" = field(converter=PartialEmoji.from_dict_safe)
     """emoji information"""
 
     _channel_id: "Snowflake_Type" = field(converter=to_snowflake)
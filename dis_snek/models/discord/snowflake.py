@@ -21,6 +21,9 @@ def to_snowflake(snowflake: Snowflake_Type) -> int:
     For Discord-API - facing code, just int() is sufficient
 
     """
+    if type(snowflake) is int:
+        # already an id, the common case for cache lookups
+        return snowflake
     try:
         snowflake = int(snowflake)
     except TypeError as e:
@@ -49,11 +52,21 @@ def to_optional_snowflake(snowflake: Absent[Optional[Snowflake_Type]] = MISSING)
 
 
 def to_snowflake_list(snowflakes: List[Snowflake_Type]) -> List[int]:
-    return [to_snowflake(c) for c in snowflakes]
+    return list(map(to_snowflake, snowflakes))
 
 
-@define(slots=False)
-class SnowflakeObject:
+class _ObjectSlots:
+    """
+    The slot layout shared by SnowflakeObject and ClientObject.
+
+    DiscordObject inherits from both, python only allows that for slotted classes if their bases share one layout.
+    """
+
+    __slots__ = ("id", "_client", "__weakref__")
+
+
+@define()
+class SnowflakeObject(_ObjectSlots):
     id: int = field(repr=True, converter=to_snowflake, metadata={"docs": "Discord unique snowflake ID"})
 
     def __eq__(self, other: "SnowflakeObject") -> bool:
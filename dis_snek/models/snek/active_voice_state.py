@@ -14,6 +14,7 @@ from dis_snek.models.discord.snowflake import Snowflake_Type, to_snowflake
 from dis_snek.models.discord.voice_state import VoiceState
 
 if TYPE_CHECKING:
+    from dis_snek.api.events import RawGatewayEvent
     from dis_snek.api.voice.audio import BaseAudio
 
 
@@ -29,6 +30,8 @@ class ActiveVoiceState(VoiceState):
     player: Optional[Player] = field(default=None)
     """The playback task that broadcasts audio data to discord"""
     _volume: float = field(default=0.5)
+    _voice_state: Optional["RawGatewayEvent"] = field(default=None, init=False)
+    _voice_server: Optional["RawGatewayEvent"] = field(default=None, init=False)
 
     # standard voice states expect this data, this voice state lacks it initially; so we make them optional
     user_id: "Snowflake_Type" = field(default=MISSING, converter=optional(to_snowflake))
@@ -0,0 +1,75 @@
+import asyncio
+from typing import List, Optional
+
+from dis_snek.models.discord.guild import AuditLogHistory
+
+__all__ = ("test_history_pages", "test_history_early_break", "test_history_search")
+
+
+class FakeEntry:
+    def __init__(self, entry_id: int) -> None:
+        self.id = entry_id
+
+
+class FakeLog:
+    def __init__(self, entries: List[FakeEntry]) -> None:
+        self.entries = entries
+
+
+class FakeGuild:
+    """Serves an audit log of entries 999 down to 751, newest first."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def fetch_audit_log(
+        self, user_id, action_type, before: Optional[int] = None, after: Optional[int] = None, limit: int = 100
+    ) -> FakeLog:
+        self.calls.append((before, limit))
+        start = before or 1000
+        return FakeLog([FakeEntry(i) for i in range(start - 1, max(start - 1 - limit, 750), -1)])
+
+
+def test_history_pages() -> None:
+    guild = FakeGuild()
+    entries = asyncio.run(AuditLogHistory(guild, limit=150).flatten())
+
+    assert [e.id for e in entries] == list(range(999, 849, -1))
+    assert guild.calls == [(None, 100), (900, 50)]
+
+
+def test_history_early_break() -> None:
+    guild = FakeGuild()
+    history = AuditLogHistory(guild, limit=250)
+
+    async def take(count: int) -> None:
+        async for _ in history:
+            count -= 1
+            if not count:
+                break
+
+    asyncio.run(take(5))
+    # nothing is requested ahead while most of the page is still unread
+    assert history._prefetch is None
+    assert guild.calls == [(None, 100)]
+
+    async def take_and_close(count: int) -> None:
+        await take(count)
+        assert history._prefetch is not None
+        await history.aclose()
+
+    asyncio.run(take_and_close(90))
+    assert history._prefetch is None
+
+
+def test_history_search() -> None:
+    guild = FakeGuild()
+    history = AuditLogHistory(guild, limit=250)
+
+    async def search() -> bool:
+        found = await history.search(905)
+        assert history._prefetch is None
+        return found
+
+    assert asyncio.run(search())
+    assert len(history._retrieved_objects) == 95
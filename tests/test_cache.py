@@ -1,12 +1,23 @@
+import asyncio
+
 import discord_typings
 import pytest
 
 from dis_snek.client.client import Snake
+from dis_snek.client.errors import NotFound
 from dis_snek.models.discord.channel import DM, GuildText
 from dis_snek.models.discord.snowflake import to_snowflake
 from tests.consts import SAMPLE_DM_DATA, SAMPLE_GUILD_DATA, SAMPLE_USER_DATA
 
-__all__ = ("bot", "test_dm_channel", "test_get_user_from_dm", "test_guild_channel", "test_update_guild")
+__all__ = (
+    "bot",
+    "test_dm_channel",
+    "test_get_user_from_dm",
+    "test_guild_channel",
+    "test_update_guild",
+    "test_fetch_missing_emoji",
+    "test_guild_voice_states",
+)
 
 
 @pytest.fixture()
@@ -57,3 +68,68 @@ def test_update_guild(bot: Snake) -> None:
     data["mfa_level"] = 1
     bot.cache.place_guild_data(data)
     assert guild.mfa_level == 1
+
+
+def test_fetch_missing_emoji(bot: Snake) -> None:
+    class Response:
+        status = 404
+        reason = "Not Found"
+
+    calls = []
+
+    async def get_guild_emoji(guild_id, emoji_id) -> None:
+        calls.append(emoji_id)
+        raise NotFound(Response(), response_data={"message": "Unknown Emoji", "code": 10014})
+
+    bot.http.get_guild_emoji = get_guild_emoji
+
+    async def fetch() -> NotFound:
+        with pytest.raises(NotFound) as exc_info:
+            await bot.cache.fetch_emoji(1, 2)
+        return exc_info.value
+
+    first = asyncio.run(fetch())
+    second = asyncio.run(fetch())
+    assert len(calls) == 1
+    assert second is not first
+    assert second.code == 10014
+
+
+def test_guild_voice_states(bot: Snake) -> None:
+    guild = bot.cache.place_guild_data(SAMPLE_GUILD_DATA())
+    bot.cache.place_channel_data(
+        {
+            "id": "12345",
+            "type": 2,
+            "guild_id": SAMPLE_GUILD_DATA()["id"],
+            "position": 0,
+            "permission_overwrites": [],
+            "name": "voice",
+            "bitrate": 64000,
+            "user_limit": 0,
+            "parent_id": None,
+            "rtc_region": None,
+        }
+    )
+    state = {
+        "guild_id": SAMPLE_GUILD_DATA()["id"],
+        "user_id": SAMPLE_USER_DATA()["id"],
+        "session_id": "session",
+        "deaf": False,
+        "mute": False,
+        "self_deaf": False,
+        "self_mute": False,
+        "self_video": False,
+        "suppress": False,
+        "request_to_speak_timestamp": None,
+    }
+
+    asyncio.run(bot.cache.place_voice_state_data(state | {"channel_id": "12345"}))
+    assert bot.cache.guild_voice_states[guild.id] == {to_snowflake(SAMPLE_USER_DATA()["id"])}
+
+    asyncio.run(bot.cache.place_voice_state_data(state | {"channel_id": None}))
+    assert guild.id not in bot.cache.guild_voice_states
+
+    asyncio.run(bot.cache.place_voice_state_data(state | {"channel_id": "12345"}))
+    bot.cache.delete_guild(guild.id)
+    assert guild.id not in bot.cache.guild_voice_states
@@ -15,3 +15,37 @@ def test_emoji_comparisons() -> None:
     assert not e == custom_emoji
     assert e.name == "sparklesnek"
     assert e.id == 910496037708374016
+
+
+def test_emoji_formatting() -> None:
+    for emoji_str in ("<:sparklesnek:910496037708374016>", "<a:sparklesnek:910496037708374016>", "👍"):
+        assert str(PartialEmoji.from_str(emoji_str)) == emoji_str
+
+    e = PartialEmoji.from_str("a:sparklesnek:910496037708374016")
+    assert e.animated
+    assert str(e) == "<a:sparklesnek:910496037708374016>"
+
+    e = PartialEmoji.from_str(":sparklesnek:910496037708374016")
+    assert not e.animated
+    assert e.req_format == "sparklesnek:910496037708374016"
+
+    # the whole string has to be an emoji, one embedded in other text is not picked out
+    e = PartialEmoji.from_str("snek <:sparklesnek:910496037708374016>")
+    assert e.id is None
+    assert e.name == "snek <:sparklesnek:910496037708374016>"
+
+
+def test_emoji_hashing() -> None:
+    custom = PartialEmoji.from_str("<:sparklesnek:910496037708374016>")
+    renamed = PartialEmoji(id=910496037708374016, name="renamed")
+    thumbs = PartialEmoji.from_str("👍")
+
+    assert custom == custom
+    assert custom == renamed
+    assert hash(custom) == hash(renamed)
+    assert thumbs == PartialEmoji.from_str("👍")
+    assert hash(thumbs) == hash(PartialEmoji.from_str("👍"))
+    assert custom != thumbs
+
+    assert len({custom, renamed, thumbs, PartialEmoji.from_str("👍")}) == 2
+    assert {custom: 1}[renamed] == 1
@@ -0,0 +1,44 @@
+from dis_snek.api import events
+from dis_snek.client.const import MISSING
+from dis_snek.client.utils.attr_utils import define, field
+
+__all__ = ("test_event_construction", "test_event_repr", "test_guild_event", "test_user_event_subclass")
+
+
+def test_event_construction() -> None:
+    event = events.Login()
+    assert event.override_name is None
+    assert event.bot is MISSING
+    assert event.resolved_name == "login"
+    assert not hasattr(event, "__dict__")
+
+    event = events.RawGatewayEvent({"a": 1}, override_name="raw_message_create")
+    assert event.data == {"a": 1}
+    assert event.resolved_name == "raw_message_create"
+
+    event = events.TypingStart(None, None, None, timestamp=1600000000)
+    assert event.timestamp.timestamp() == 1600000000
+
+
+def test_event_repr() -> None:
+    assert repr(events.Login()) == "Login()"
+    assert repr(events.BanCreate("123456789012345678", None)) == "BanCreate()"
+    assert repr(events.RawGatewayEvent({})) == "RawGatewayEvent()"
+
+
+def test_guild_event() -> None:
+    event = events.MemberUpdate("123456789012345678", None, None)
+    assert event.guild_id == 123456789012345678
+    assert event.resolved_name == "member_update"
+
+
+def test_user_event_subclass() -> None:
+    @define(kw_only=False)
+    class CustomEvent(events.BaseEvent):
+        value: int = field(repr=True)
+
+    event = CustomEvent(3, override_name="my_event")
+    assert event.value == 3
+    assert event.override_name == "my_event"
+    assert event.bot is MISSING
+    assert repr(event) == "CustomEvent(value=3)"
@@ -0,0 +1,91 @@
+import asyncio
+import contextlib
+import json
+import time
+from typing import Any, AsyncIterator
+
+from dis_snek.api.http.http_client import HTTPClient
+from dis_snek.api.http.route import Route
+
+__all__ = ("test_cached_response", "test_expired_response", "test_webhook_invalidation")
+
+
+class FakeResponse:
+    def __init__(self, data: Any) -> None:
+        self.status = 200
+        self.headers = {"content-type": "application/json"}
+        self._data = data
+
+    async def read(self) -> bytes:
+        return json.dumps(self._data).encode()
+
+
+class FakeSession:
+    closed = False
+
+    def __init__(self, data: Any = None, on_request: Any = None) -> None:
+        self.data = data
+        self.on_request = on_request
+        self.calls = []
+
+    @contextlib.asynccontextmanager
+    async def request(self, method: str, url: str, **kwargs) -> AsyncIterator[FakeResponse]:
+        self.calls.append((method, url))
+        if self.on_request:
+            self.on_request()
+        yield FakeResponse(self.data)
+
+
+def make_client(session: FakeSession) -> HTTPClient:
+    http = HTTPClient()
+    http._HTTPClient__session = session
+    return http
+
+
+def test_cached_response() -> None:
+    session = FakeSession({"id": "1", "username": "fresh"})
+    http = make_client(session)
+    route = Route("GET", "/users/1")
+
+    first = asyncio.run(http.request(route, use_cache=True))
+    first["username"] = "mutated"
+    second = asyncio.run(http.request(route, use_cache=True))
+
+    assert len(session.calls) == 1
+    assert second == {"id": "1", "username": "fresh"}
+
+
+def test_expired_response() -> None:
+    session = FakeSession({"id": "1", "username": "fresh"})
+    http = make_client(session)
+    route = Route("GET", "/users/1")
+
+    http.response_cache[route.url] = {"id": "1", "username": "stale"}
+    dict.get(http.response_cache, route.url).expire = time.monotonic() - 1
+
+    result = asyncio.run(http.request(route, use_cache=True))
+    assert len(session.calls) == 1
+    assert result["username"] == "fresh"
+    assert http.response_cache.get(route.url, reset_expiration=False)["username"] == "fresh"
+
+
+def test_webhook_invalidation() -> None:
+    url = Route("GET", "/webhooks/1").url
+    token_url = Route("GET", "/webhooks/1/token").url
+    cached_during_request = []
+
+    session = FakeSession({"id": "1"}, on_request=lambda: cached_during_request.append(url in http.response_cache))
+    http = make_client(session)
+
+    http.response_cache[url] = {"id": "1"}
+    http.response_cache[token_url] = {"id": "1"}
+    asyncio.run(http.modify_webhook(1, "name", None, 2, webhook_token="token"))
+
+    # only dropped once discord has answered, so a read racing the change cannot re-cache the old data
+    assert cached_during_request == [True]
+    assert url not in http.response_cache
+    assert token_url not in http.response_cache
+
+    http.response_cache[url] = {"id": "1"}
+    asyncio.run(http.delete_webhook(1))
+    assert url not in http.response_cache
@@ -0,0 +1,159 @@
+import attrs
+import pytest
+
+from dis_snek.client import const
+from dis_snek.client.client import Snake
+from dis_snek.client.utils import serializer
+from dis_snek.models.discord.embed import Embed
+from dis_snek.models.discord.guild import Guild
+from dis_snek.models.discord.message import Message
+from dis_snek.models.discord.user import User
+from tests.consts import SAMPLE_GUILD_DATA, SAMPLE_USER_DATA
+
+__all__ = (
+    "bot",
+    "test_embed_from_dict",
+    "test_guild_from_dict",
+    "test_from_dict_safe",
+    "test_client_object_from_dict_safe",
+    "test_embed_to_dict",
+    "test_guild_to_dict",
+    "test_message_to_dict",
+)
+
+
+@pytest.fixture()
+def bot() -> Snake:
+    return Snake()
+
+
+def SAMPLE_EMBED_DATA() -> dict:
+    return {
+        "title": "test_embed",
+        "description": "a description",
+        "url": "https://example.com",
+        "timestamp": "2021-01-01T00:00:00+00:00",
+        "color": 0xFF0000,
+        "footer": {"text": "footer text"},
+        "image": {"url": "https://example.com/image.png"},
+        "author": {"name": "author"},
+        "fields": [{"name": "field", "value": "value", "inline": True}],
+        "type": "rich",
+    }
+
+
+def field_values(obj) -> dict:
+    return attrs.asdict(obj, filter=lambda a, _: a.name != "_client")
+
+
+def reflective_to_dict(inst) -> dict:
+    """The field-by-field export the generated exporters replace."""
+    if (converter := getattr(inst, "as_dict", None)) is not None:
+        return converter()
+
+    d = {}
+    for a in attrs.fields(inst.__class__):
+        if a.metadata.get("no_export", False):
+            continue
+        if (raw_value := getattr(inst, a.name)) is const.MISSING:
+            continue
+        if (c := a.metadata.get("export_converter", None)) is not None:
+            value = c(raw_value)
+        else:
+            value = serializer._to_dict_any(raw_value)
+        if isinstance(value, (bool, int)) or value:
+            d[a.name] = value
+    return d
+
+
+def test_embed_from_dict(monkeypatch: pytest.MonkeyPatch) -> None:
+    embed = Embed.from_dict(SAMPLE_EMBED_DATA())
+    assert embed.footer.text == "footer text"
+    assert embed.fields[0].inline is True
+    # absent keys get the field default
+    assert embed.video is None
+
+    # kwarg_spam takes the plain constructor path, which the generated one has to match
+    monkeypatch.setattr(const, "kwarg_spam", True)
+    assert field_values(embed) == field_values(Embed.from_dict(SAMPLE_EMBED_DATA()))
+
+
+def test_guild_from_dict(bot: Snake, monkeypatch: pytest.MonkeyPatch) -> None:
+    guild = Guild.from_dict(SAMPLE_GUILD_DATA(), bot)
+    assert guild._client is bot
+    assert guild.id == int(SAMPLE_GUILD_DATA()["id"])
+
+    monkeypatch.setattr(const, "kwarg_spam", True)
+    reference = Guild.from_dict(SAMPLE_GUILD_DATA(), bot)
+    assert reference._client is bot
+    assert field_values(guild) == field_values(reference)
+
+
+def test_from_dict_safe() -> None:
+    embed = Embed.from_dict(SAMPLE_EMBED_DATA())
+    assert Embed.from_dict_safe(embed) is embed
+
+    copy = Embed.from_dict_safe(SAMPLE_EMBED_DATA())
+    assert copy is not embed
+    assert field_values(copy) == field_values(embed)
+
+
+def test_client_object_from_dict_safe(bot: Snake) -> None:
+    user = User.from_dict_safe(SAMPLE_USER_DATA(), bot)
+    assert user._client is bot
+    assert user.username == SAMPLE_USER_DATA()["username"]
+    assert User.from_dict_safe(user, bot) is user
+
+
+def test_embed_to_dict(monkeypatch: pytest.MonkeyPatch) -> None:
+    embed = Embed.from_dict(SAMPLE_EMBED_DATA())
+    small_embed = Embed(title="title")
+    small_embed.add_field("name", "value")
+    exported = [serializer.to_dict(embed), serializer.to_dict(small_embed)]
+
+    # nested objects are exported through `to_dict` too, so swap it out to build the reference
+    monkeypatch.setattr(serializer, "to_dict", reflective_to_dict)
+    assert exported == [reflective_to_dict(embed), reflective_to_dict(small_embed)]
+
+
+def test_guild_to_dict(bot: Snake, monkeypatch: pytest.MonkeyPatch) -> None:
+    data = SAMPLE_GUILD_DATA()
+    data["welcome_screen"] = {
+        "description": "welcome",
+        "welcome_channels": [{"channel_id": "12345", "description": "say hi", "emoji_id": None, "emoji_name": "👋"}],
+    }
+    guild = bot.cache.place_guild_data(data)
+    exported = serializer.to_dict(guild)
+    assert "_client" not in exported
+
+    monkeypatch.setattr(serializer, "to_dict", reflective_to_dict)
+    assert exported == reflective_to_dict(guild)
+
+
+def test_message_to_dict(bot: Snake) -> None:
+    message = Message.from_dict(
+        {
+            "id": "12345",
+            "channel_id": "12346",
+            "author": SAMPLE_USER_DATA(),
+            "content": "hello",
+            "timestamp": "2021-01-01T00:00:00+00:00",
+            "edited_timestamp": None,
+            "tts": False,
+            "mention_everyone": False,
+            "mentions": [],
+            "mention_roles": [],
+            "attachments": [],
+            "embeds": [],
+            "pinned": False,
+            "type": 0,
+            "reactions": [{"count": 1, "me": False, "emoji": {"id": None, "name": "👍"}}],
+        },
+        bot,
+    )
+    # populate the internal reaction index, it mirrors `reactions` and must not be exported alongside it
+    assert message._get_reaction_index()
+    exported = serializer.to_dict(message)
+    assert "reactions" in exported
+    assert "_reaction_index" not in exported
+    assert "_indexed_reactions" not in exported